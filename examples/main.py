@@ -1,11 +1,14 @@
 import asyncio
+import json
 import logging
 import pprint
 from pathlib import Path
 from quickScheduler import QuickScheduler
-from quickScheduler.backend.models import TaskModel, JobModel, model_to_dict, createTaskModel
+from quickScheduler.backend.models import TaskModel, JobModel, model_to_dict
 from quickScheduler.utils.triggers import TriggerType
 
+logger = logging.getLogger(__name__)
+
 """
 A task could be a python callable
 """
@@ -22,52 +25,60 @@ def example_failing_worker():
 """
 This is a sample customized alert sender callback function
 """
+_TASK_VIEW_FIELDS = ("hash_id", "name", "schedule_type")
+_JOB_VIEW_FIELDS = ("id", "status", "exit_code", "error_message")
+
 def customize_alert_sender(msg : str, task : TaskModel, job : JobModel):
     print("*" * 100)
     print(msg)
-    pprint.pprint(model_to_dict(task))
-    pprint.pprint(model_to_dict(job))
+    print(json.dumps({field: getattr(task, field) for field in _TASK_VIEW_FIELDS}, separators=(",", ":"), default=str))
+    print(json.dumps({field: getattr(job, field) for field in _JOB_VIEW_FIELDS}, separators=(",", ":"), default=str))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("task: %s", pprint.pformat(model_to_dict(task)))
+        logger.debug("job: %s", pprint.pformat(model_to_dict(job)))
     print("*" * 100)
 
 """
 Tasks can be defined programmably in code, or loaded from yaml config files. 
 """
-# Example programmatic tasks
+# Example programmatic tasks, built and hashed once at import time
+_EXAMPLE_TASKS = TaskModel.bulk_calculate_hash_ids([
+    TaskModel(
+        name="Memory Monitor",
+        description="Monitor system memory usage and alert if above threshold",
+        schedule_type=TriggerType.DAILY,
+        schedule_config={
+            "run_time" : "12:00",
+            "timezone" : "America/New_York"
+        },
+        command="free -h"
+    ),
+    TaskModel(
+        name="Hello World",
+        description="Print 'Hello World!' to the console",
+        schedule_type=TriggerType.DAILY,
+        schedule_config={
+            "run_time" : "12:00",
+            "timezone" : "America/New_York"
+        },
+        callable_func = example_worker
+    ),
+    TaskModel(
+        name="Job to fail",
+        description="Print 'Hello World!' to the console",
+        schedule_type=TriggerType.IMMEDIATE,
+        callable_func = example_failing_worker
+    ),
+    # TaskModel(
+    #     name="Multiple commands task",
+    #     description="Run multiple commands in sequence",
+    #     schedule_type=TriggerType.IMMEDIATE,
+    #     command=["echo 'Hello World!'", "echo 'Goodbye World!'"]
+    # )
+])
+
 def create_example_tasks():
-    return [
-        createTaskModel(
-            name="Memory Monitor",
-            description="Monitor system memory usage and alert if above threshold",
-            schedule_type=TriggerType.DAILY,
-            schedule_config={
-                "run_time" : "12:00",
-                "timezone" : "America/New_York"
-            },
-            command="free -h"
-        ),
-        createTaskModel(
-            name="Hello World",
-            description="Print 'Hello World!' to the console",
-            schedule_type=TriggerType.DAILY,
-            schedule_config={
-                "run_time" : "12:00",
-                "timezone" : "America/New_York"
-            },
-            callable_func = example_worker
-        ),
-        createTaskModel(
-            name="Job to fail",
-            description="Print 'Hello World!' to the console",
-            schedule_type=TriggerType.IMMEDIATE,
-            callable_func = example_failing_worker
-        ),
-        # createTaskModel(
-        #     name="Multiple commands task",
-        #     description="Run multiple commands in sequence",
-        #     schedule_type=TriggerType.IMMEDIATE,
-        #     command=["echo 'Hello World!'", "echo 'Goodbye World!'"]
-        # )
-    ]
+    return list(_EXAMPLE_TASKS)
 
 async def main():
     import os
@@ -78,7 +89,7 @@ async def main():
     if not os.path.exists(str(config_filename)):
         config_filename = current_dir / "config.yml"
     
-    logging.info(f"starting quick scheduler using config file {config_filename}")
+    logger.info("starting quick scheduler using config file %s", config_filename)
     # Create programmatic tasks
     tasks = create_example_tasks()
     
@@ -89,12 +100,18 @@ async def main():
                     send_alert_callable = customize_alert_sender
                 )
     
-    try:
-        # Run the scheduler
-        scheduler.run()
-    except KeyboardInterrupt:
-        print("\nShutting down scheduler...")
+    # Run the scheduler
+    await scheduler.run_async()
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO, format='[%(levelname)s][%(asctime)s] %(message)s')
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        # Optional: libuv-based event loop, falls back to the default asyncio loop
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nShutting down scheduler...")
\ No newline at end of file
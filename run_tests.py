@@ -5,9 +5,9 @@ Usage:
     ./run_tests.py
 """
 
+import importlib.util
 import os
 import sys
-import subprocess
 
 def main():
     """Run all tests using pytest."""
@@ -29,14 +29,15 @@ def main():
         "-c",
         tests_dir  # Path to tests directory
     ]
-    
-    # Run pytest as a subprocess
-    print(f"command: {' '.join(pytest_args)}")
-    result = subprocess.Popen(pytest_args)
-    result.wait()
 
-    # Exit with the same status code as pytest
-    sys.exit(result.returncode)
+    # Spread test files over all CPUs when pytest-xdist is installed. loadfile keeps
+    # each file on one worker, so module/session fixtures and env changes stay local.
+    if importlib.util.find_spec("xdist") is not None:
+        pytest_args += ["-n", "auto", "--dist", "loadfile"]
+    
+    # Replace this process with pytest, its exit code goes straight to the caller
+    print(f"command: {' '.join(pytest_args)}", flush=True)
+    os.execvp(pytest_args[0], pytest_args)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,6 +1,10 @@
+import asyncio
+import importlib
 import os
 import logging
-from typing import Callable, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Sequence
 import time
 
 from quickScheduler.backend.api import API
@@ -10,12 +14,24 @@ from quickScheduler.frontend.app import FrontEnd
 from quickScheduler.utils.yaml_config import YamlConfig
 from quickScheduler.utils.triggers import TriggerType
 
+logger = logging.getLogger(__name__)
+
 
 class QuickScheduler:
-    def __init__(self, config_file : str, tasks : List[TaskModel] = [], send_alert_callable : Callable = None):
+    def __init__(self, config_file : str, tasks : Sequence[TaskModel] = (), send_alert_callable : Callable = None,
+                 config_json_cache : bool = False):
+        """
+        Args:
+            config_file: Path to the YAML configuration file
+            tasks: Tasks to schedule in addition to the ones found in the tasks directory
+            send_alert_callable: Optional callable used to send alerts
+            config_json_cache: If True, keep a '<config_file>.cache.json' sidecar next to the
+                               config file so later starts can skip YAML parsing. The sidecar
+                               holds the parsed config, including any secrets in it.
+        """
         self.config_file = config_file
-        self.config = YamlConfig(config_file)
-        self.tasks = tasks
+        self.config = YamlConfig(config_file, json_cache = config_json_cache)
+        self.tasks = tuple(tasks)
         self.send_alert_callable = send_alert_callable
         self.backend_api_host = self.config.get("backend_api_host", "127.0.0.1")
         self.backend_api_port = self.config.get("backend_api_port", 8000)
@@ -23,7 +39,25 @@ class QuickScheduler:
         self.frontend_host = self.config.get("frontend_host", "0.0.0.0")
         self.frontend_port = self.config.get("frontend_port", 8001)
         self.url_prefix = self.config.get("url_prefix", f"http://{self.frontend_host}:{self.frontend_port}").strip().rstrip("/")
+        self.data_dir = self.config.get("data_dir", "~/.schedulerData/")
+        self.tasks_dir = os.path.join(self.data_dir, "tasks")
         self.email_config = self.parse_email_config()
+        self._cv = threading.Condition()
+        self._exited_threads = set()
+        self._async_wakeup = None  # (loop, asyncio.Event) while run_async() is running
+
+        # The API/frontend threads import uvicorn lazily; importing it here only moves
+        # that one-time cost from the first start into construction
+        importlib.import_module("uvicorn")
+
+    def _on_thread_exit(self):
+        """Called from a component thread as it exits, wakes up the supervisor in run()."""
+        with self._cv:
+            self._exited_threads.add(threading.current_thread())
+            self._cv.notify_all()
+            if self._async_wakeup is not None:
+                loop, wakeup = self._async_wakeup
+                loop.call_soon_threadsafe(wakeup.set)
     
     def parse_email_config(self) -> Optional[EmailConfig]:
         if "smtp_server" in self.config:
@@ -43,16 +77,16 @@ class QuickScheduler:
         self.api = API(
             host = self.backend_api_host,
             port = self.backend_api_port,
-            working_directory = self.config.get("data_dir", "~/.schedulerData/"),
+            working_directory = self.data_dir,
             email_config = self.email_config,
             send_alert_callable = self.send_alert_callable,
             url_prefix = self.url_prefix
         )
-        self.api_thread = self.api.run_api_in_thread()
+        self.api_thread = self.api.run_api_in_thread(on_exit = self._on_thread_exit)
         trial = 0
         while trial < 5:
             if not self.api_thread.is_alive():
-                logging.info("API server not ready, retrying...")
+                logger.info("API server not ready, retrying...")
                 trial += 1
                 time.sleep(1)
             else:
@@ -61,16 +95,16 @@ class QuickScheduler:
     
     def start_scheduler(self):
         self.scheduler = Scheduler(
-            config_dir = os.path.join(self.config.get("data_dir", "~/.schedulerData"), "tasks"),
-            working_directory = self.config.get("data_dir", "~/.schedulerData/"),
+            config_dir = self.tasks_dir,
+            working_directory = self.data_dir,
             tasks = self.tasks,
             backend_api_url = self.backend_api_url
         )
-        self.scheduler_thread = self.scheduler.run_in_thread()
+        self.scheduler_thread = self.scheduler.run_in_thread(on_exit = self._on_thread_exit)
         trial = 0
         while trial < 5:
             if not self.scheduler_thread.is_alive():
-                logging.info("Scheduler not ready, retrying...")
+                logger.info("Scheduler not ready, retrying...")
                 trial += 1
                 time.sleep(1)
             else:
@@ -84,34 +118,77 @@ class QuickScheduler:
             backend_api_url = self.backend_api_url,
             config = self.config
         )
-        self.frontend_thread = self.frontend.run_in_thread()
+        self.frontend_thread = self.frontend.run_in_thread(on_exit = self._on_thread_exit)
         trial = 0
         while trial < 5:
             if not self.frontend_thread.is_alive():
-                logging.info("Frontend not ready, retrying...")
+                logger.info("Frontend not ready, retrying...")
                 trial += 1
                 time.sleep(1)
             else:
                 return
         raise Exception("Frontend not ready")
 
-    def run(self):
-        self.start_api()
-        self.start_scheduler()
-        self.start_frontend()
+    def start_all(self):
+        """Start the API, scheduler and frontend threads."""
+        # The frontend is independent, so start it while the API and scheduler come up.
+        # The scheduler stays behind the API: both create the same sqlite schema and
+        # the scheduler triggers immediate tasks through the API right away.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            frontend_future = executor.submit(self.start_frontend)
+            self.start_api()
+            self.start_scheduler()
+            frontend_future.result()
 
         assert self.api_thread.is_alive(), f"failed to start API server"
         assert self.scheduler_thread.is_alive(), f"failed to start scheduler"
         assert self.frontend_thread.is_alive(), f"failed to start frontend"
 
+    def _restart_exited(self, exited):
+        """Join the exited threads and restart the components that are no longer alive."""
+        # The exiting thread is still alive when it notifies, so join it before checking is_alive()
+        for thread in exited:
+            thread.join()
+
+        if not self.api_thread.is_alive():
+            logger.info("API server stopped, restarting...")
+            self.start_api()
+        if not self.scheduler_thread.is_alive():
+            logger.info("Scheduler stopped, restarting...")
+            self.start_scheduler()
+        if not self.frontend_thread.is_alive():
+            logger.info("Frontend stopped, restarting...")
+            self.start_frontend()
+
+    def run(self):
+        """Start all components and restart any of them that stops, blocking forever."""
+        self.start_all()
+
         while True:
-            if not self.api_thread.is_alive():
-                logging.info("API server stopped, restarting...")
-                self.start_api()
-            if not self.scheduler_thread.is_alive():
-                logging.info("Scheduler stopped, restarting...")
-                self.start_scheduler()
-            if not self.frontend_thread.is_alive():
-                logging.info("Frontend stopped, restarting...")
-                self.start_frontend()
-            time.sleep(1)
\ No newline at end of file
+            # Sleep until a component thread exits instead of polling them
+            with self._cv:
+                self._cv.wait_for(lambda: self._exited_threads)
+                exited, self._exited_threads = self._exited_threads, set()
+            self._restart_exited(exited)
+
+    async def run_async(self):
+        """Same as run(), but supervises the components from a running asyncio event loop.
+
+        Exiting threads wake the loop through call_soon_threadsafe, so no executor
+        thread is parked waiting on a component that is still running.
+        """
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        with self._cv:
+            self._async_wakeup = (loop, wakeup)
+        try:
+            await asyncio.to_thread(self.start_all)
+            while True:
+                await wakeup.wait()
+                wakeup.clear()
+                with self._cv:
+                    exited, self._exited_threads = self._exited_threads, set()
+                await asyncio.to_thread(self._restart_exited, exited)
+        finally:
+            with self._cv:
+                self._async_wakeup = None
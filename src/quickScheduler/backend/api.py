@@ -342,11 +342,7 @@ class API:
                 JSON response with job count
             """
             db_session = db.get_session()
-            if task_hash_id is not None:
-                jobs = db.get_jobs_by_task_hash_id(db_session, task_hash_id)
-            else:
-                jobs = db.get_jobs(db_session)
-            return {"count": len(jobs)}
+            return {"count": db.count_jobs(db_session, task_hash_id)}
 
         @app.get("/jobs/{job_id}", response_model=models.Job)
         async def get_job(job_id: int):
@@ -606,11 +602,19 @@ class API:
                     if self.send_alert_callable:
                         self.send_alert_callable(subject, task, job)
 
-    def run_api_in_thread(self):
-        """Run the FastAPI application in a separate thread."""
+    def run_api_in_thread(self, on_exit: Optional[Callable] = None):
+        """Run the FastAPI application in a separate thread.
+
+        Args:
+            on_exit (Optional[Callable]): Called from the worker thread when the server stops.
+        """
         def worker():
             import uvicorn
-            uvicorn.run(self.app, host=self.host, port=self.port, log_level="info")
+            try:
+                uvicorn.run(self.app, host=self.host, port=self.port, log_level="info")
+            finally:
+                if on_exit is not None:
+                    on_exit()
 
         self.thread = threading.Thread(target=worker, daemon=True)
         self.thread.start()
@@ -5,9 +5,10 @@ backend. It includes models for Tasks and Jobs, along with database initializati
 and session management functionality.
 """
 from typing import Optional, List
-from sqlalchemy import create_engine, inspect, text, desc, asc
-from sqlalchemy.pool import NullPool
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, inspect, text, desc, asc, func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool, StaticPool
+from sqlalchemy.orm import sessionmaker, selectinload, Session
 
 from .models import Base, TaskModel, JobModel
 
@@ -26,15 +27,21 @@ class Database:
 
         Args:
             db_url: SQLAlchemy database URL. Defaults to SQLite database in current directory.
+                    In-memory SQLite URLs (e.g. 'sqlite:///:memory:' or
+                    'sqlite:///file::memory:?cache=shared&uri=true') are supported.
         """
         connect_args = {}
         if 'sqlite' in db_url:
             connect_args['check_same_thread'] = False
 
+        # An in-memory SQLite database only lives as long as its connection,
+        # so share a single connection instead of opening one per session.
+        poolclass = StaticPool if self._is_sqlite_memory_url(db_url) else NullPool
+
         self.engine = create_engine(
             db_url,
             connect_args=connect_args,
-            poolclass=NullPool,
+            poolclass=poolclass,
             echo=False,  # Enable SQL logging for debugging
             future=True  # Enable SQLAlchemy 2.0 behavior
         )
@@ -51,6 +58,17 @@ class Database:
             future=True  # Enable SQLAlchemy 2.0 behavior
         )
 
+    @staticmethod
+    def _is_sqlite_memory_url(db_url: str) -> bool:
+        """Check if a database URL points to an in-memory SQLite database."""
+        url = make_url(db_url)
+        if url.get_backend_name() != 'sqlite':
+            return False
+        if url.database in (None, '', ':memory:') or url.query.get('mode') == 'memory':
+            return True
+        # URI filenames, e.g. 'sqlite:///file::memory:?cache=shared&uri=true'
+        return url.query.get('uri') == 'true' and (url.database or '').startswith('file::memory:')
+
     def __enter__(self):
         self.session = self.SessionLocal()
         return self
@@ -109,6 +127,23 @@ class Database:
         """
         return session.query(TaskModel).filter(TaskModel.hash_id == task_hash_id).first()
 
+    def get_task_with_jobs(self, session: Session, task_hash_id: str) -> Optional[TaskModel]:
+        """Get a task by its ID with its jobs eagerly loaded.
+
+        Args:
+            session: Database session
+            task_hash_id: ID of the task to retrieve
+
+        Returns:
+            The task if found, None otherwise
+        """
+        return (
+            session.query(TaskModel)
+            .options(selectinload(TaskModel.jobs))
+            .filter(TaskModel.hash_id == task_hash_id)
+            .first()
+        )
+
     def get_tasks(self, session: Session, skip: int = 0, limit: int = 100) -> List[TaskModel]:
         """Get a list of tasks with pagination.
 
@@ -232,15 +267,19 @@ class Database:
         Returns:
             Total number of tasks
         """
-        return session.query(TaskModel).count()
+        return session.scalar(select(func.count()).select_from(TaskModel))
         
-    def count_jobs(self, session: Session) -> int:
-        """Count all jobs in the database.
+    def count_jobs(self, session: Session, task_hash_id: Optional[str] = None) -> int:
+        """Count jobs in the database.
 
         Args:
             session: Database session
+            task_hash_id: Optional task ID to count only that task's jobs
 
         Returns:
             Total number of jobs
         """
-        return session.query(JobModel).count()
\ No newline at end of file
+        statement = select(func.count()).select_from(JobModel)
+        if task_hash_id is not None:
+            statement = statement.where(JobModel.task_hash_id == task_hash_id)
+        return session.scalar(statement)
\ No newline at end of file
@@ -5,6 +5,7 @@ in the quickScheduler backend. It includes models for Tasks (which define what a
 when to run) and Jobs (which represent specific instances of task execution).
 """
 
+import functools
 import hashlib
 import json
 from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, ForeignKey, true
@@ -12,7 +13,7 @@ from sqlalchemy.orm import relationship, declarative_base, validates
 from sqlalchemy.inspection import inspect
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List
 
 from pydantic import BaseModel, Field, field_validator
 from quickScheduler.utils.triggers import TriggerType, TriggerConfig
@@ -23,12 +24,61 @@ def model_to_dict(model):
     """Convert SQLAlchemy model instance to dictionary."""
     return {c.key: getattr(model, c.key) for c in inspect(model).mapper.column_attrs}
 
+# Fields that make up TaskModel.hash_id, in signature order
+_HASH_ID_FIELDS = (
+    'name', 'command', 'description', 'schedule_type', 'schedule_config',
+    'environment', 'max_retries', 'retry_delay', 'timeout'
+)
+
+def _freeze(value):
+    """Convert a JSON-like value into a hashable signature.
+
+    Scalars are tagged with their type so that e.g. 1, 1.0 and True, which
+    hash equal but serialize differently, get different signatures.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((k, _freeze(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(_freeze(v) for v in value))
+    return (type(value), value)
+
+def _thaw(frozen):
+    """Inverse of _freeze()."""
+    kind, value = frozen
+    if kind is dict:
+        return {k: _thaw(v) for k, v in value}
+    if kind is list:
+        return [_thaw(v) for v in value]
+    return value
+
+# Reused for every hash, produces the same output as json.dumps(..., sort_keys=True)
+_HASH_ID_ENCODER = json.JSONEncoder(sort_keys=True)
+
+def _hash_unique_data(unique_data : dict) -> str:
+    data_str = _HASH_ID_ENCODER.encode(unique_data)
+    return hashlib.sha256(data_str.encode()).hexdigest()
+
+@functools.lru_cache(maxsize=1024)
+def _hash_id_for(signature : tuple) -> str:
+    """Hash id for a frozen task signature, memoized on the signature."""
+    return _hash_unique_data({field: _thaw(v) for field, v in zip(_HASH_ID_FIELDS, signature)})
+
 class GlobalCallableFunctions:
     _all_functions = {}
+    # id(func) -> (func, key) for the functions stored in _all_functions, which keep
+    # their ids from being reused; other callables sharing a key are not remembered
+    _keys_by_id = {}
 
     @classmethod
     def register_function(cls, func : Callable) -> str:
-        """Register a global callable function."""
+        """Register a global callable function.
+
+        Registering the same function object again returns the existing key.
+        """
+        entry = cls._keys_by_id.get(id(func))
+        if entry is not None and entry[0] is func:
+            return entry[1]
+
         assert callable(func), f"{func} is not a callable function"
         
         _name   = func.__name__
@@ -37,6 +87,7 @@ class GlobalCallableFunctions:
         key = f"{_file}:{_module}.{_name}"
         if key not in cls._all_functions:
             cls._all_functions[key] = func
+            cls._keys_by_id[id(func)] = (func, key)
         return key
     
     @classmethod
@@ -80,23 +131,26 @@ class TaskModel(Base):
                        onupdate=lambda: datetime.now(timezone.utc))
     
     def calculate_hash_id(self):
-        """Calculate a unique ID for the task."""
-        unique_data = {
-            'name': self.name,
-            'command': self.command,
-            'description': self.description,
-            'schedule_type': self.schedule_type,
-            'schedule_config': self.schedule_config,
-            'environment': self.environment,
-            'max_retries': self.max_retries,
-            'retry_delay': self.retry_delay,
-            'timeout': self.timeout
-        }
-        data_str = json.dumps(unique_data, sort_keys=True)
-        hash_obj = hashlib.sha256(data_str.encode())
-        self.hash_id = hash_obj.hexdigest()
+        """Calculate a unique ID for the task.
+
+        Identical task definitions share a cached hash, so repeated calls
+        skip the JSON serialization and sha256.
+        """
+        try:
+            signature = tuple(_freeze(getattr(self, field)) for field in _HASH_ID_FIELDS)
+            self.hash_id = _hash_id_for(signature)
+        except TypeError:
+            # unhashable or unsortable values, hash them directly
+            self.hash_id = _hash_unique_data({field: getattr(self, field) for field in _HASH_ID_FIELDS})
         return self
 
+    @classmethod
+    def bulk_calculate_hash_ids(cls, tasks : List["TaskModel"]) -> List["TaskModel"]:
+        """Calculate the hash id of every task in a list and return the list."""
+        for task in tasks:
+            task.calculate_hash_id()
+        return tasks
+
     jobs = relationship("JobModel", back_populates="task")
 
     @validates('schedule_type')
@@ -13,7 +13,7 @@ import time
 import pytz
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from quickScheduler.backend.database import Database
 from quickScheduler.backend.models import TaskModel
@@ -31,17 +31,17 @@ class Scheduler:
     - Running the main event loop for task execution
     """
 
-    def __init__(self, config_dir: str, working_directory: str = ".", tasks: Optional[List[TaskModel]] = None, backend_api_url: str = "http://localhost:8000"):
+    def __init__(self, config_dir: str, working_directory: str = ".", tasks: Optional[Iterable[TaskModel]] = None, backend_api_url: str = "http://localhost:8000"):
         """Initialize the Scheduler.
 
         Args:
             config_dir: Directory containing task YAML configuration files
-            tasks: Optional list of TaskModel objects to include in scheduling
+            tasks: Optional iterable of TaskModel objects to include in scheduling
         """
         self.working_directory = working_directory
         self.config_dir = Path(config_dir)
         self.db = Database(db_url=f"sqlite:///{self.working_directory}/quickscheduler.db")
-        self.tasks = tasks or []
+        self.tasks = list(tasks) if tasks is not None else []
         self.task_triggers: Dict[str, Tuple[TaskModel, BaseTrigger]] = {}
         self.all_tasks = {}
         self.backend_api_url = backend_api_url
@@ -259,8 +259,19 @@ class Scheduler:
                 if self._reload_yaml_tasks():
                     self.sync_tasks()
     
-    def run_in_thread(self):
-        """Run the scheduler in a separate thread."""
-        thread = threading.Thread(target=self.run)
+    def run_in_thread(self, on_exit: Optional[Callable] = None):
+        """Run the scheduler in a separate thread.
+
+        Args:
+            on_exit: Optional callable invoked from the worker thread when the loop exits
+        """
+        def worker():
+            try:
+                self.run()
+            finally:
+                if on_exit is not None:
+                    on_exit()
+
+        thread = threading.Thread(target=worker)
         thread.start()
         return thread
\ No newline at end of file
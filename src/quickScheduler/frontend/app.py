@@ -424,11 +424,19 @@ class FrontEnd:
         import uvicorn
         uvicorn.run(self.app, host=self.host, port=self.port, log_level="info")
     
-    def run_in_thread(self):
-        """Run the FastAPI application in a separate thread."""
+    def run_in_thread(self, on_exit=None):
+        """Run the FastAPI application in a separate thread.
+
+        Args:
+            on_exit: Optional callable invoked from the worker thread when the server stops.
+        """
         def worker():
             import uvicorn
-            uvicorn.run(self.app, host=self.host, port=self.port, log_level="info")
+            try:
+                uvicorn.run(self.app, host=self.host, port=self.port, log_level="info")
+            finally:
+                if on_exit is not None:
+                    on_exit()
 
         self.thread = threading.Thread(target=worker, daemon=True)
         self.thread.start()
@@ -4,7 +4,9 @@ This module provides functions for:
 1. Parsing datetime strings in various formats
 2. Converting between UTC and local timezones
 """
-from datetime import datetime, date, time, timedelta
+import functools
+import re
+from datetime import datetime, date, time, timedelta, timezone as dt_timezone
 from click import Option
 import pytz
 from typing import Optional, Union
@@ -53,6 +55,37 @@ def parse_timedelta(timedelta_str: str) -> timedelta:
         raise ValueError(f"Invalid timedelta format: {timedelta_str}")
 
 
+# Matches the shapes accepted by parse_datetime's default formats
+_ISO_DATETIME_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:([ T])(\d{2}):(\d{2}):(\d{2})"
+    r"(?:\.(\d{1,6})Z?|([+-])(\d{2}):?([0-5]\d))?)?\Z"
+)
+
+def _parse_iso_datetime(datetime_str: str) -> Optional[datetime]:
+    """Parse the default datetime formats without strptime.
+
+    Returns None when the string is not one of those shapes, or holds an out of
+    range value, so the caller can fall back to strptime.
+    """
+    match = _ISO_DATETIME_RE.match(datetime_str)
+    if match is None:
+        return None
+    year, month, day, sep, hour, minute, second, fraction, sign, tz_hours, tz_minutes = match.groups()
+    if sep == " " and (fraction is not None or sign is not None):
+        return None
+    try:
+        if sep is None:
+            return datetime(int(year), int(month), int(day))
+        tzinfo = None
+        if sign is not None:
+            offset = timedelta(hours=int(tz_hours), minutes=int(tz_minutes))
+            tzinfo = dt_timezone(-offset if sign == "-" else offset)
+        microsecond = int(fraction.ljust(6, "0")) if fraction is not None else 0
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), microsecond, tzinfo)
+    except ValueError:
+        return None
+
 def parse_datetime(datetime_str: str, formats: Optional[list[str]] = None) -> datetime:
     """Parse a datetime string using specified formats.
     
@@ -68,6 +101,9 @@ def parse_datetime(datetime_str: str, formats: Optional[list[str]] = None) -> da
     """
     if not isinstance(datetime_str, str): return
     if formats is None:
+        parsed = _parse_iso_datetime(datetime_str)
+        if parsed is not None:
+            return parsed
         formats = [
             "%Y-%m-%d %H:%M:%S",  # 2023-12-25 13:45:30
             "%Y-%m-%dT%H:%M:%S",  # 2023-12-25T13:45:30
@@ -112,6 +148,11 @@ def parse_date(date_str : str, formats : Optional[list[str]] = None) -> date:
     
     raise ValueError(f"Could not parse date string '{date_str}' with any of the formats: {formats}")
 
+@functools.lru_cache(maxsize=256)
+def _tz(name: str):
+    """Return the pytz timezone for a name, memoized per name."""
+    return pytz.timezone(name)
+
 def convert_to_local(dt: Union[datetime, str], timezone: str = "UTC") -> datetime:
     """Convert a UTC datetime to local time.
     
@@ -133,7 +174,7 @@ def convert_to_local(dt: Union[datetime, str], timezone: str = "UTC") -> datetim
     if dt.tzinfo is None:
         dt = pytz.UTC.localize(dt)
     
-    target_tz = pytz.timezone(timezone)
+    target_tz = _tz(timezone)
     return dt.astimezone(target_tz)
 
 def get_local_timezone() -> str:
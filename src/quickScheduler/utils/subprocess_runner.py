@@ -8,6 +8,8 @@ environment variable configuration, and output logging.
 import os
 import sys
 import time
+import select
+import signal
 import logging
 import tempfile
 import subprocess
@@ -76,6 +78,8 @@ class SubProcessRunner:
                      a temporary file will be created.
         """
         self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()  # guards starting a process against stop()
+        self._stop_requested = threading.Event()
         self.process: Optional[subprocess.Popen] = None
         self.log_file = log_file or tempfile.mktemp(prefix='subprocess_runner_')
         self.logger = logging.getLogger(__name__)
@@ -105,6 +109,8 @@ class SubProcessRunner:
                 if not isinstance(cmd, str):
                     raise TypeError("All commands in the list must be strings")
                 self._run(cmd, env=env, shell=True, **kwargs)
+                if self._stop_requested.is_set():
+                    break
                 status = self.get_status()
                 exit_code = status["exit_code"]
                 if exit_code != 0:
@@ -127,16 +133,19 @@ class SubProcessRunner:
                 final_env = os.environ.copy()
                 if env:
                     final_env.update(env)
-                self.process = subprocess.Popen(
-                    target,
-                    shell=True,
-                    env=final_env,
-                    stdout=log_file,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    **kwargs
-                )
-                self.process.wait()
+                with self._lock:
+                    if self._stop_requested.is_set():
+                        return
+                    process = self.process = subprocess.Popen(
+                        target,
+                        shell=True,
+                        env=final_env,
+                        stdout=log_file,
+                        stderr=subprocess.STDOUT,
+                        text=True,
+                        **kwargs
+                    )
+                process.wait()
         
         elif callable(target):
             # For Python callables
@@ -150,10 +159,13 @@ class SubProcessRunner:
             serialized_func = dill.dumps(target)
             
             p = Process(target=_run_python_callable, args=(serialized_func, child_conn, self.log_file))
-            p.start()
-            self.process = p
-            self.conn = parent_conn
-            self.process.join()
+            with self._lock:
+                if self._stop_requested.is_set():
+                    return
+                p.start()
+                self.process = p
+                self.conn = parent_conn
+            p.join()
         else:
             raise TypeError("Target must be either a callable or a string command")
 
@@ -177,7 +189,10 @@ class SubProcessRunner:
         """
         if self._thread is not None:
             raise ValueError("Process is already running")
+        if not (callable(target) or isinstance(target, (str, list))):
+            raise TypeError("Target must be either a callable or a string command")
 
+        self._stop_requested.clear()
         self._thread = threading.Thread(
             target=self._run,
             args=(target,),
@@ -209,6 +224,54 @@ class SubProcessRunner:
                 return True
         return False
 
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the started target has finished.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait indefinitely
+
+        Returns:
+            bool: True if nothing is running anymore, False if the timeout expired
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.is_running()
+
+    def _terminate_popen(self, process: subprocess.Popen, timeout: float = 5) -> None:
+        """Send SIGTERM to a shell process and wait for it, killing it after timeout seconds.
+
+        On Linux the wait goes through a pidfd, which becomes readable as soon as
+        the process exits, so there is no polling on waitpid.
+        """
+        if not hasattr(os, "pidfd_open"):
+            process.terminate()
+            try:
+                process.wait(timeout=timeout)  # Wait up to timeout seconds for graceful termination
+            except subprocess.TimeoutExpired:
+                self.logger.warning("Process did not terminate gracefully, forcing...")
+                process.kill()
+                process.wait()
+            return
+
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except ProcessLookupError:
+            return  # already exited and reaped by the worker thread
+        try:
+            if process.returncode is not None:
+                return  # reaped before pidfd_open, the pid may have been reused
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            signal.pidfd_send_signal(pidfd, signal.SIGTERM)
+            if not poller.poll(timeout * 1000):
+                self.logger.warning("Process did not terminate gracefully, forcing...")
+                signal.pidfd_send_signal(pidfd, signal.SIGKILL)
+                poller.poll()
+        except ProcessLookupError:
+            pass  # exited between pidfd_open and the signal
+        finally:
+            os.close(pidfd)
+
     def stop(self) -> None:
         """Stop the currently running process.
 
@@ -217,32 +280,28 @@ class SubProcessRunner:
         """
         if not self.is_running():
             raise ValueError("No process is running")
-        
-        if self.process is not None:
-            if isinstance(self.process, subprocess.Popen):
-                self.process.terminate()
-                try:
-                    self.process.wait(timeout=5)  # Wait up to 5 seconds for graceful termination
-                except subprocess.TimeoutExpired:
-                    self.logger.warning("Process did not terminate gracefully, forcing...")
-                    self.process.kill()
-                    self.process.wait()
+
+        # Keep the worker thread from starting a (further) process, then stop the current one
+        self._stop_requested.set()
+        with self._lock:
+            process = self.process
+
+        if process is not None:
+            if isinstance(process, subprocess.Popen):
+                self._terminate_popen(process)
             else: # multiprocessing.Process
-                if self.process.is_alive():
-                    self.process.terminate()
-                    try:
-                        self.process.join(timeout=5)  # Wait up to 5 seconds for graceful termination
-                    except subprocess.TimeoutExpired:
+                if process.is_alive():
+                    process.terminate()
+                    process.join(timeout=5)  # Wait up to 5 seconds for graceful termination
+                    if process.is_alive():
                         self.logger.warning("Process did not terminate gracefully, forcing...")
-                        self.process.terminate()
-                        self.process.join()
+                        process.kill()
+                        process.join()
             self.process = None
 
-        if self._thread is not None:
-            if self._thread.is_alive():
-                self._thread._stop()
-                self._thread.join()
-            self._thread = None
+        # The worker thread returns once its process has exited
+        self._thread.join()
+        self._thread = None
 
     def get_status(self) -> Dict[str, Any]:
         """Get the current status of the process.
@@ -99,6 +99,9 @@ class TriggerConfig(BaseModel):
         return rst
 
 class BaseTrigger(ABC):
+    # Triggers are created per task and queried on every scheduler tick
+    __slots__ = ("trigger_type", "config")
+
     def __init__(self, trigger_type: TriggerType, config: Optional[TriggerConfig]):
         self.trigger_type = trigger_type
         self.config = config
@@ -144,6 +147,7 @@ class BaseTrigger(ABC):
 
 class ImmediateTrigger(BaseTrigger):
     """A trigger that fires immediately, but only once"""
+    __slots__ = ("_has_triggered",)
     
     def __init__(self, trigger_type: TriggerType, config: Optional[TriggerConfig]):
         super().__init__(trigger_type, config)
@@ -161,6 +165,7 @@ class ImmediateTrigger(BaseTrigger):
 
 class DailyTrigger(BaseTrigger):
     """A trigger that fires at a specific time each day, filtered by weekdays and dates"""
+    __slots__ = ()
     
     def __init__(self, trigger_type: TriggerType, config: TriggerConfig):
         super().__init__(trigger_type, config)
@@ -216,6 +221,7 @@ class DailyTrigger(BaseTrigger):
 
 class IntervalTrigger(BaseTrigger):
     """A trigger that fires at regular intervals between a start and end time each day"""
+    __slots__ = ()
     
     def __init__(self, trigger_type: TriggerType, config: TriggerConfig):
         super().__init__(trigger_type, config)
@@ -1,40 +1,235 @@
 """YamlConfig - A utility class for YAML configuration management.
 
 This module provides a class for reading and managing YAML configuration files,
-supporting environment variable substitution and comment preservation.
+supporting environment variable substitution and imports/includes of other files.
 """
 
+import functools
+import json
 import os
 import re
-from typing import Any, Dict, Optional, Union
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
 from pathlib import Path
 
 from ruamel.yaml import YAML
+from ruamel.yaml.constructor import SafeConstructor
+
+# Parsed YAML documents keyed by (path, mtime_ns, size, inode, loader type, constructor,
+# preserve_quotes); the constructor decides e.g. whether !import/!include tags are accepted.
+# Editing or atomically replacing a file changes its stat signature, so stale
+# entries are never returned; they simply age out of the LRU.
+_PARSE_CACHE_SIZE = 100
+_parse_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+# ${EnvVarName} references, and the __import__(path) / __include__(path) directives
+_ENV_VAR_RE = re.compile(r'\${([^}]+)}')
+_DIRECTIVE_RE = re.compile(r'__(import|include)__\(\s*([^)]+)\s*\)')
+_DIRECTIVE_PREFIXES = ('__import__(', '__include__(')
+
+
+def _match_directive(value: str) -> Optional[Tuple[str, str]]:
+    """Return (directive, file_path) if the whole string is an __import__/__include__ directive."""
+    # Almost no scalar starts with a directive, so check that before running the regex
+    stripped = value.strip()
+    if stripped.startswith(_DIRECTIVE_PREFIXES) and stripped.endswith(')'):
+        directive_match = _DIRECTIVE_RE.fullmatch(stripped)
+        if directive_match:
+            return directive_match.groups()
+    return None
+
+
+def _clean_directive_path(file_path: str) -> str:
+    """Strip whitespace and optional quotes around a directive's file path."""
+    return file_path.strip().strip('\'"')
+
+
+def _expand_env_vars(value: str) -> str:
+    """Replace ${EnvVarName} references with their values, or '' when unset.
+
+    This runs on parsed scalars rather than on the raw file text, so a value
+    containing YAML syntax (': ', '#', newlines) cannot change the document's
+    structure, and parsed documents stay independent of the environment.
+    """
+    if '${' not in value:
+        return value  # most scalars, skip the regex
+    return _ENV_VAR_RE.sub(lambda m: os.environ.get(m.group(1), ''), value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _abs_path(base_dir: str, file_path: str) -> str:
+    """Return file_path as a normalized absolute path, relative paths resolved against base_dir.
+
+    base_dir must be absolute, so the result does not depend on the working directory.
+    """
+    return os.path.normpath(os.path.join(base_dir, file_path))
+
+
+_JSON_CACHE_SUFFIX = ".cache.json"
+_MISSING = object()
+
+
+def _is_json_safe(value: Any) -> bool:
+    """Check if a parsed YAML value survives a JSON round trip unchanged."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return True
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_json_safe(v) for k, v in value.items())
+    if isinstance(value, list):
+        return all(_is_json_safe(v) for v in value)
+    return False
+
+
+def _stat_meta(st: os.stat_result) -> Dict[str, int]:
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "ino": st.st_ino}
+
+
+def _read_json_cache(file_path: Path, st: os.stat_result) -> Any:
+    """Read the JSON sidecar of a YAML file, or _MISSING if it is absent or stale."""
+    try:
+        with open(str(file_path) + _JSON_CACHE_SUFFIX, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return _MISSING
+    if not isinstance(cached, dict) or cached.get("meta") != _stat_meta(st):
+        return _MISSING
+    return cached.get("data")
+
+
+def _write_json_cache(file_path: Path, st: os.stat_result, data: Any) -> None:
+    """Atomically write the JSON sidecar of a YAML file, skipping data JSON cannot represent."""
+    if not _is_json_safe(data):
+        return
+    cache_file = str(file_path) + _JSON_CACHE_SUFFIX
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump({"meta": _stat_meta(st), "data": data}, f)
+        os.replace(tmp_path, cache_file)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _load_yaml_file(file_path: Path, yaml: YAML, json_cache: bool = False) -> Any:
+    """Load a YAML file, reusing the parsed document while the file is unchanged.
+
+    The returned document is shared between callers and must not be mutated;
+    YamlConfig only reads it while building its own substituted copy.
+
+    Args:
+        file_path: Path to the YAML file
+        yaml: The ruamel YAML instance used to parse on a cache miss
+        json_cache: If True, also keep a '<file>.cache.json' sidecar so that a
+                    fresh process can skip YAML parsing while the file is unchanged
+
+    Returns:
+        The parsed YAML document
+    """
+    st = os.stat(file_path)
+    key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size, st.st_ino, tuple(yaml.typ), yaml.Constructor, yaml.preserve_quotes)
+    with _parse_cache_lock:
+        if key in _parse_cache:
+            _parse_cache.move_to_end(key)
+            return _parse_cache[key]
+
+    data = _read_json_cache(file_path, st) if json_cache else _MISSING
+    if data is _MISSING:
+        # One bulk read; the parser decodes the bytes itself (UTF-8 unless there is a BOM)
+        data = yaml.load(Path(file_path).read_bytes())
+        if json_cache:
+            _write_json_cache(file_path, st, data)
+
+    with _parse_cache_lock:
+        _parse_cache[key] = data
+        _parse_cache.move_to_end(key)
+        while len(_parse_cache) > _PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return data
+
+
+class _Directive(NamedTuple):
+    """An '!import path' or '!include path' node, resolved by YamlConfig after parsing."""
+    kind: str
+    path: str
+
+
+class _ConfigConstructor(SafeConstructor):
+    """Safe constructor that also understands the !import and !include tags.
+
+    A subclass, so that registering the tags leaves ruamel's SafeConstructor untouched.
+    """
+
+
+for _kind in ("import", "include"):
+    _ConfigConstructor.add_constructor(
+        f"!{_kind}",
+        lambda constructor, node, kind=_kind: _Directive(kind, constructor.construct_scalar(node))
+    )
+
+
+def _safe_yaml() -> YAML:
+    """Create the ruamel YAML instance YamlConfig parses with by default.
+
+    The safe loader builds plain dicts and lists, and runs on libyaml when
+    ruamel.yaml.clib is installed (falling back to pure Python otherwise).
+    YamlConfig rebuilds the document during substitution anyway, so the
+    comments and styles kept by the round-trip loader were never used.
+    Its constructor also accepts the !import and !include tags.
+    """
+    yaml = YAML(typ="safe")
+    yaml.Constructor = _ConfigConstructor
+    return yaml
 
 
 class YamlConfig:
     """A class to manage YAML configuration files with environment variable support.
 
     This class provides functionality to:
-    - Load YAML configuration files with comment preservation
+    - Load YAML configuration files
     - Substitute environment variables in the format ${EnvVarName}
+    - Import or include other files with '!import path' / '!include path'
+      (or the older '__import__(path)' / '__include__(path)' strings)
     - Reload configurations from file
     - Access configuration values through dictionary-like interface
     - Track and monitor imported/included configuration files for changes
     """
 
-    def __init__(self, config_file: Union[str, Path]):
+    def __init__(self, config_file: Union[str, Path], json_cache: bool = False, yaml: Optional[YAML] = None,
+                 _importers: Tuple[str, ...] = ()):
         """Initialize the YamlConfig.
 
         Args:
             config_file: Path to the YAML configuration file
+            json_cache: If True, cache the parsed file in a '<config_file>.cache.json'
+                        sidecar that is reused by later processes while the file is unchanged
+            yaml: Optional ruamel YAML instance to reuse for parsing, e.g. across many
+                  configs loaded by the same thread. Defaults to a new safe instance
+                  that also accepts the !import and !include tags.
+            _importers: Absolute paths of the files currently importing this one, used
+                        internally to detect circular imports/includes
         """
         self.config_file = Path(config_file)
-        self.yaml = YAML()
-        self.yaml.preserve_quotes = True
-        self.yaml.indent(mapping=2, sequence=4, offset=2)
+        # Directory that relative import/include paths are resolved against
+        self._base_dir = os.path.abspath(self.config_file.parent)
+        self.json_cache = json_cache
+        self.yaml = yaml if yaml is not None else _safe_yaml()
         self.config_data = {}
         self.dependencies = {}
+        self._importers = _importers
+        # Absolute paths of the files being resolved, from the outermost importer down
+        self._resolving = []
+        # Substituted data of the files included so far in the current load, by absolute path
+        self._included = {}
         
         if self.config_file.exists():
             self.reload()
@@ -48,14 +243,24 @@ class YamlConfig:
             file_path: The file path to resolve
 
         Returns:
-            The resolved Path object
+            The resolved, normalized absolute Path object
         """
-        path = Path(file_path)
-        if path.is_absolute():
-            return path
-        else:
-            # Resolve relative to the directory containing the current config file
-            return self.config_file.parent / path
+        # Relative paths are resolved against the directory containing the current config file
+        return Path(_abs_path(self._base_dir, file_path))
+
+    def _check_cycle(self, file_path: Path) -> None:
+        """Raise if a file is imported or included while it is still being resolved.
+
+        Args:
+            file_path: Resolved path of the file about to be imported or included
+
+        Raises:
+            ValueError: If the file is already on the chain of files being resolved
+        """
+        abs_path = str(file_path)
+        if abs_path in self._resolving:
+            cycle = self._resolving[self._resolving.index(abs_path):] + [abs_path]
+            raise ValueError(f"Circular import/include detected: {' -> '.join(cycle)}")
 
     def _import_config(self, file_path: str) -> Any:
         """Import another YAML config file as a value.
@@ -69,17 +274,21 @@ class YamlConfig:
         resolved_path = self._resolve_path(file_path)
         if not resolved_path.exists():
             raise FileNotFoundError(f"Imported configuration file not found: {resolved_path}")
+        self._check_cycle(resolved_path)
         
         # Track this dependency
         self._track_dependency(resolved_path)
         
         # Create a new YamlConfig instance for the imported file
-        imported_config = YamlConfig(resolved_path)
+        imported_config = YamlConfig(resolved_path, yaml=self.yaml, _importers=tuple(self._resolving))
         return imported_config.config_data
 
     def _include_config(self, file_path: str) -> Dict[str, Any]:
         """Include another YAML config file and merge its contents.
 
+        Unlike imports, a file included several times in one load is resolved once
+        and every occurrence shares the same data, so it must not be mutated in place.
+
         Args:
             file_path: Path to the YAML file to include
 
@@ -89,20 +298,65 @@ class YamlConfig:
         resolved_path = self._resolve_path(file_path)
         if not resolved_path.exists():
             raise FileNotFoundError(f"Included configuration file not found: {resolved_path}")
+        self._check_cycle(resolved_path)
+        abs_path = str(resolved_path)
+        if abs_path in self._included:
+            return self._included[abs_path]
         
         # Track this dependency
         self._track_dependency(resolved_path)
         
         # Load the included file directly
-        yaml = YAML()
-        with open(resolved_path, 'r') as f:
-            included_data = yaml.load(f) or {}
+        included_data = _load_yaml_file(resolved_path, self.yaml) or {}
         
         # Process the included data for environment variables and nested imports/includes
-        return self._substitute_env_vars(included_data)
+        self._resolving.append(abs_path)
+        try:
+            self._included[abs_path] = self._substitute_env_vars(included_data)
+        finally:
+            self._resolving.pop()
+        return self._included[abs_path]
+
+    def _resolve_directive(self, directive: str, file_path: str) -> Any:
+        """Resolve an import or include directive.
+
+        Args:
+            directive: Either "import" or "include"
+            file_path: Path of the file to import or include, quotes allowed
+
+        Returns:
+            The imported/included configuration data
+        """
+        file_path = _clean_directive_path(file_path)
+        if directive == "import":
+            return self._import_config(file_path)
+        return self._include_config(file_path)
+
+    def _substitute_string(self, value: str) -> Any:
+        """Substitute environment variables in a string and resolve it if it is an import/include.
+
+        Args:
+            value: The string configuration value to process
+
+        Returns:
+            The substituted string, or the imported/included configuration data
+        """
+        # Handle environment variables: ${EnvVarName}
+        result = _expand_env_vars(value)
+        
+        # Handle __import__(file_path) and __include__(file_path) when they make up the entire string
+        directive = _match_directive(result)
+        if directive:
+            return self._resolve_directive(*directive)
+        
+        return result
 
     def _substitute_env_vars(self, value: Any) -> Any:
-        """Recursively substitute environment variables and handle imports/includes in configuration values.
+        """Substitute environment variables and handle imports/includes throughout a configuration value.
+
+        The tree is walked with an explicit stack instead of one recursive call per
+        node. Dicts and lists are copied rather than updated in place, because parsed
+        documents are shared through the parse cache.
 
         Args:
             value: The configuration value to process
@@ -110,39 +364,25 @@ class YamlConfig:
         Returns:
             The processed value with environment variables substituted and imports/includes processed
         """
-        if isinstance(value, str):
-            # Handle environment variables: ${EnvVarName}
-            env_pattern = r'\${([^}]+)}'
-            env_matches = re.findall(env_pattern, value)
-            
-            result = value
-            for env_var in env_matches:
-                env_value = os.environ.get(env_var, '')
-                result = result.replace(f"${{{env_var}}}", env_value)
-            
-            # Handle __import__(file_path) pattern
-            import_pattern = r'__import__\(\s*([^)]+)\s*\)'
-            import_match = re.search(import_pattern, result)
-            if import_match and result.strip() == import_match.group(0):
-                # If the entire string is an import directive
-                file_path = import_match.group(1).strip().strip('\'"')
-                return self._import_config(file_path)
-            
-            # Handle __include__(file_path) pattern
-            include_pattern = r'__include__\(\s*([^)]+)\s*\)'
-            include_match = re.search(include_pattern, result)
-            if include_match and result.strip() == include_match.group(0):
-                # If the entire string is an include directive
-                file_path = include_match.group(1).strip().strip('\'"')
-                return self._include_config(file_path)
-            
-            return result
-        elif isinstance(value, dict):
-            return {k: self._substitute_env_vars(v) for k, v in value.items()}
-        elif isinstance(value, list):
-            return [self._substitute_env_vars(item) for item in value]
-        else:
-            return value
+        root = [value]
+        # (container, key, node): node is processed and stored as container[key]
+        stack = [(root, 0, value)]
+        while stack:
+            container, key, node = stack.pop()
+            if isinstance(node, str):
+                container[key] = self._substitute_string(node)
+            elif isinstance(node, _Directive):
+                container[key] = self._resolve_directive(node.kind, _expand_env_vars(node.path))
+            elif isinstance(node, dict):
+                container[key] = copy = dict(node)
+                # Reversed, so that children are processed in document order
+                stack.extend((copy, k, v) for k, v in reversed(node.items()))
+            elif isinstance(node, list):
+                container[key] = copy = list(node)
+                stack.extend((copy, i, item) for i, item in reversed(list(enumerate(node))))
+            else:
+                container[key] = node
+        return root[0]
 
     def _track_dependency(self, file_path: Path) -> None:
         """Track a dependency file and its last modification time.
@@ -186,9 +426,10 @@ class YamlConfig:
         """
         # Clear dependencies before reloading
         self.dependencies = {}
+        self._resolving = [*self._importers, os.path.abspath(self.config_file)]
+        self._included = {}
         
-        with open(self.config_file, 'r') as f:
-            self.config_data = self.yaml.load(f) or {}
+        self.config_data = _load_yaml_file(self.config_file, self.yaml, self.json_cache) or {}
         
         # Track the main config file itself
         self._track_dependency(self.config_file)
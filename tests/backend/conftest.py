@@ -1,14 +1,95 @@
+from unittest.mock import DEFAULT, patch
+
 import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
 from quickScheduler.backend.database import Database
 from quickScheduler.backend.models import Base
+from quickScheduler.utils.subprocess_runner import SubProcessRunner
+
+# Built once at import; children before parents so foreign keys stay valid
+_CLEAR_TABLES = [table.delete() for table in reversed(Base.metadata.sorted_tables)]
+
+def _clear_tables(db: Database) -> None:
+    with db.engine.begin() as conn:
+        for statement in _CLEAR_TABLES:
+            conn.execute(statement)
+
+# Durability does not matter for throwaway test databases
+_TEST_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA synchronous=OFF;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA cache_size=-65536;"
+)
+
+def _set_test_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.executescript(_TEST_PRAGMAS)
+    cursor.close()
+
+def _use_test_pragmas(db: Database) -> None:
+    event.listen(db.engine, "connect", _set_test_pragmas)
+
+@pytest.fixture(scope="session")
+def fast_sqlite():
+    """Return a function that applies the test PRAGMAs to every new connection of a Database."""
+    return _use_test_pragmas
+
+@pytest.fixture(scope="session")
+def clear_database():
+    """Return a function that deletes all rows from a Database."""
+    return _clear_tables
+
+@pytest.fixture(scope="session")
+def memory_db():
+    """Create a single in-memory database shared by the whole test session.
+
+    The schema is created once; tests are isolated by the rollback in db below.
+    """
+    memory_db = Database("sqlite:///file::memory:?cache=shared&uri=true")
+
+    # pysqlite does not emit BEGIN itself before a SAVEPOINT, so releasing the
+    # first savepoint would commit for real. Let SQLAlchemy control BEGIN instead.
+    with memory_db.engine.connect() as conn:
+        conn.connection.driver_connection.isolation_level = None
+
+    @event.listens_for(memory_db.engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    return memory_db
+
+@pytest.fixture
+def db(memory_db):
+    """Yield the shared database with every session joined to a per-test transaction.
+
+    Sessions commit to a SAVEPOINT, and the outer transaction is rolled back on
+    teardown, so each test starts from the same empty tables.
+    """
+    connection = memory_db.engine.connect()
+    transaction = connection.begin()
+    session_factory = memory_db.SessionLocal
+    memory_db.SessionLocal = sessionmaker(
+        bind=connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint"
+    )
+    try:
+        yield memory_db
+    finally:
+        memory_db.SessionLocal = session_factory
+        transaction.rollback()
+        connection.close()
 
 @pytest.fixture(autouse=True)
-def clean_database():
-    """Clean up the database before each test.
-    
-    This fixture runs automatically before each test,
-    ensuring a clean database state for proper test isolation.
+def mock_runner():
+    """Keep backend tests from spawning real subprocesses.
+
+    SubProcessRunner.start does nothing and get_status reports a successful
+    run; tests can change mock_runner["get_status"].return_value per case.
     """
-    db = Database()
-    Base.metadata.drop_all(db.engine)
-    Base.metadata.create_all(db.engine)
\ No newline at end of file
+    with patch.multiple(SubProcessRunner, start=DEFAULT, get_status=DEFAULT) as mocks:
+        mocks["get_status"].return_value = {"running": False, "exit_code": 0, "output": "", "error": ""}
+        yield mocks
@@ -0,0 +1,108 @@
+"""Test cases for the API module.
+
+This module contains test cases for the FastAPI application exposed by the API class.
+The application and its TestClient are built once per session; only the database
+rows are reset between tests.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from quickScheduler.backend import api, models
+
+
+@pytest.fixture(scope="session")
+def app(tmp_path_factory, fast_sqlite):
+    """Create the API application once for the whole test session."""
+    working_directory = tmp_path_factory.mktemp("api")
+    app = api.API(working_directory=str(working_directory))
+    fast_sqlite(app.db)
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Create a TestClient shared by all API tests."""
+    return TestClient(app.app)
+
+
+@pytest.fixture(autouse=True)
+def clean_api_database(app, clear_database):
+    """Delete all rows from the API database before each test."""
+    clear_database(app.db)
+
+
+@pytest.fixture
+def task(app):
+    """Insert a sample task directly into the API database."""
+    task = models.TaskModel(
+        name="API Test Task",
+        command="echo 'test'",
+        schedule_type=models.TriggerType.DAILY,
+        schedule_config={"run_time": "12:00", "timezone": "UTC"},
+    ).calculate_hash_id()
+    with app.db.get_session() as session:
+        session.add(task)
+        session.commit()
+    return task
+
+
+def test_health_check(client):
+    """Test the health check endpoint."""
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json() == {"status": "healthy", "database": "connected"}
+
+
+def test_get_task(client, task):
+    """Test retrieving a task by hash id."""
+    response = client.get(f"/tasks/{task.hash_id}")
+    assert response.status_code == 200
+    assert response.json()["hash_id"] == task.hash_id
+    assert response.json()["name"] == task.name
+
+
+def test_list_tasks(client, task):
+    """Test listing tasks only returns rows created by this test."""
+    tasks = client.get("/tasks/").json()
+    assert len(tasks) == 1
+    assert tasks[0]["hash_id"] == task.hash_id
+
+
+def test_get_missing_task(client):
+    """Test retrieving a task that doesn't exist."""
+    assert client.get("/tasks/").json() == []
+    response = client.get("/tasks/nonexistent")
+    assert response.status_code == 404
+
+
+def test_delete_task(client, task):
+    """Test deleting a task."""
+    response = client.delete(f"/tasks/{task.hash_id}")
+    assert response.status_code == 200
+    assert client.get(f"/tasks/{task.hash_id}").status_code == 404
+
+
+def test_job_count(app, client, task):
+    """Test counting all jobs and the jobs of one task."""
+    with app.db.get_session() as session:
+        session.add_all(
+            [models.JobModel(task_hash_id=task.hash_id, status=models.JobStatus.COMPLETED) for _ in range(2)]
+            + [models.JobModel(task_hash_id="other", status=models.JobStatus.COMPLETED)]
+        )
+        session.commit()
+
+    assert client.get("/jobs/count").json() == {"count": 3}
+    assert client.get("/jobs/count", params={"task_hash_id": task.hash_id}).json() == {"count": 2}
+
+
+def test_trigger_task(app, client, task, mock_runner):
+    """Test triggering a task runs its command and records a completed job."""
+    response = client.post(f"/tasks/{task.hash_id}/trigger")
+    assert response.status_code == 200
+    job_id = response.json()["job_id"]
+
+    assert mock_runner["start"].call_args.kwargs["target"] == task.command
+    job = client.get(f"/jobs/{job_id}").json()
+    assert job["status"] == models.JobStatus.COMPLETED.value
+    assert job["exit_code"] == 0
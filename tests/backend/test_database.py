@@ -9,39 +9,32 @@ This module contains test cases for the Database class and database models, cove
 
 import pytest
 import pytz
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 import uuid
-from sqlalchemy import text, inspect
+from sqlalchemy import event, text, inspect
 
 from quickScheduler.backend import database, models
-from quickScheduler.backend.models import Base
-@pytest.fixture(scope="module")
-def db(tmp_path_factory):
-    """Create a test database instance."""
-    # Use a temporary file-based SQLite database
-    db_path = tmp_path_factory.mktemp("data") / "test.db"
-    db_url = f"sqlite:///{db_path}"
-    
-    # Initialize database and create tables
-    db = database.Database(db_url)
-    with db.get_session() as session:
-        # Verify tables exist
-        inspector = inspect(session.connection())
-        assert "tasks" in inspector.get_table_names()
-        assert "jobs" in inspector.get_table_names()
-    
-    yield db
-    
-    # Clean up database file
-    db_path.unlink(missing_ok=True)
-    # Clean up after all tests
-    Base.metadata.drop_all(db.engine)
+
+
+@contextmanager
+def count_queries(db):
+    """Collect the SQL statements executed on db while the block runs."""
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
 
 
 @pytest.fixture
 def task_model():
-    """Create a sample task model."""
-    import uuid
+    """Create a sample task model with its hash_id already calculated."""
     return database.TaskModel(
         name=f"Test Task {uuid.uuid4()}",
         command="echo 'test'",
@@ -53,7 +46,7 @@ def task_model():
         timeout=300,
         max_retries=3,
         retry_delay=60
-    )
+    ).calculate_hash_id()
 
 
 def test_database_initialization(db):
@@ -61,14 +54,18 @@ def test_database_initialization(db):
     assert db is not None
     with db.get_session() as session:
         assert session is not None
+        # Verify tables exist
+        inspector = inspect(session.connection())
+        assert "tasks" in inspector.get_table_names()
+        assert "jobs" in inspector.get_table_names()
 
 
 def test_create_task(db, task_model):
     """Test creating a task in the database."""
     with db.get_session() as session:
-        session.add(task_model.calculate_hash_id())
-        session.commit()
-        session.refresh(task_model.calculate_hash_id())
+        session.add(task_model)
+        session.flush()
+        session.refresh(task_model)
         
         assert task_model.id is not None
         assert task_model.created_at is not None
@@ -78,9 +75,8 @@ def test_create_task(db, task_model):
 def test_get_task_by_id(db, task_model):
     """Test retrieving a task by ID."""
     with db.get_session() as session:
-        session.add(task_model.calculate_hash_id())
-        session.commit()
-        session.refresh(task_model.calculate_hash_id())
+        session.add(task_model)
+        session.flush()
         
         retrieved_task = db.get_task_by_id(session, task_model.hash_id)
         assert retrieved_task is not None
@@ -91,9 +87,9 @@ def test_get_task_by_id(db, task_model):
 def test_update_task(db, task_model):
     """Test updating a task."""
     with db.get_session() as session:
-        session.add(task_model.calculate_hash_id())
-        session.commit()
-        session.refresh(task_model.calculate_hash_id())
+        session.add(task_model)
+        session.flush()
+        session.refresh(task_model)
         
         task_id = task_model.id
         original_updated_at = task_model.updated_at
@@ -102,7 +98,7 @@ def test_update_task(db, task_model):
         task_model.name = "Updated Task"
         task_model.command = "echo 'updated'"
         session.commit()
-        session.refresh(task_model.calculate_hash_id())
+        session.refresh(task_model)
         
         assert task_model.id == task_id
         assert task_model.name == "Updated Task"
@@ -115,7 +111,6 @@ def test_delete_task(db, task_model):
     with db.get_session() as session:
         # Create test task with jobs
         session.add(task_model)
-        session.commit()
         
         # Create associated jobs
         job1 = database.JobModel(
@@ -131,7 +126,7 @@ def test_delete_task(db, task_model):
             status=models.JobStatus.FAILED
         )
         session.add_all([job1, job2])
-        session.commit()
+        session.flush()
 
         # Delete the task
         result = db.delete_task(session, task_model.hash_id)
@@ -162,7 +157,7 @@ def test_task_deletion_maintains_integrity(db, task_model):
             schedule_config={"interval_seconds": 300}
         )
         session.add_all([task1, task2])
-        session.commit()
+        session.flush()
 
         initial_count = db.count_tasks(session)
         
@@ -177,17 +172,13 @@ def test_task_deletion_maintains_integrity(db, task_model):
 def test_create_job(db, task_model):
     """Test creating a job for a task."""
     with db.get_session() as session:
-        session.add(task_model.calculate_hash_id())
-        session.commit()
-        session.refresh(task_model.calculate_hash_id())
-        
         job = database.JobModel(
             task_hash_id=task_model.hash_id,
             trigger_time=datetime.now(pytz.UTC),
             status=models.JobStatus.PENDING
         )
-        session.add(job)
-        session.commit()
+        session.add_all([task_model, job])
+        session.flush()
         session.refresh(job)
         
         assert job.id is not None
@@ -199,21 +190,18 @@ def test_create_job(db, task_model):
 def test_job_lifecycle(db, task_model):
     """Test job status transitions."""
     with db.get_session() as session:
-        session.add(task_model.calculate_hash_id())
-        session.commit()
-        
         job = database.JobModel(
             task_hash_id=task_model.hash_id,
             trigger_time=datetime.now(pytz.UTC),
             status=models.JobStatus.PENDING
         )
-        session.add(job)
-        session.commit()
+        session.add_all([task_model, job])
+        session.flush()
         
         # Test status transitions
         job.status = models.JobStatus.RUNNING
         job.start_time = datetime.now(pytz.UTC)
-        session.commit()
+        session.flush()
         
         job.status = models.JobStatus.COMPLETED
         job.end_time = datetime.now(pytz.UTC)
@@ -228,8 +216,7 @@ def test_job_lifecycle(db, task_model):
 def test_task_jobs_relationship(db, task_model):
     """Test relationship between task and its jobs."""
     with db.get_session() as session:
-        session.add(task_model.calculate_hash_id())
-        session.commit()
+        session.add(task_model)
         
         # Create multiple jobs for the task
         jobs = [
@@ -241,12 +228,17 @@ def test_task_jobs_relationship(db, task_model):
             for i in range(3)
         ]
         session.add_all(jobs)
-        session.commit()
+        session.flush()
         
-        # Verify task-jobs relationship
-        task = db.get_task_by_id(session, task_model.hash_id)
-        assert len(task.jobs) == 3
-        assert all(job.task_hash_id == task.hash_id for job in task.jobs)
+        task_hash_id = task_model.hash_id
+        session.expire_all()
+
+        # Verify task-jobs relationship, loading the jobs with a single extra query
+        with count_queries(db) as queries:
+            task = db.get_task_with_jobs(session, task_hash_id)
+            assert len(task.jobs) == 3
+            assert all(job.task_hash_id == task.hash_id for job in task.jobs)
+        assert len(queries) <= 2
 
 
 def test_task_validation(db):
@@ -275,3 +267,65 @@ def test_task_validation(db):
             )
             session.add(task)
             session.commit()
+
+
+def test_register_function_registry_bounded():
+    """Test registering many distinct callables sharing one key does not grow the registry."""
+    class Worker:
+        def run(self):
+            return "ok"
+
+    worker = Worker()
+    registry = models.GlobalCallableFunctions
+    key = registry.register_function(worker.run)
+    lambda_key = registry.register_function(lambda: "ok")
+    sizes = (len(registry._all_functions), len(registry._keys_by_id))
+
+    for _ in range(1000):
+        # Every attribute access creates a new bound method object
+        assert registry.register_function(worker.run) == key
+        assert registry.register_function(lambda: "ok") == lambda_key
+    assert (len(registry._all_functions), len(registry._keys_by_id)) == sizes
+
+    # The stored object is still served from the id cache
+    stored = registry.get_function(key)
+    assert registry.register_function(stored) == key
+    assert registry._keys_by_id[id(stored)] == (stored, key)
+
+
+def test_calculate_hash_id_cache():
+    """Test cached hash ids match a direct computation and respect value types."""
+    def make(**kwargs):
+        return database.TaskModel(
+            name="Hash Task",
+            command=["echo 1", "echo 2"],
+            schedule_type=models.TriggerType.INTERVAL,
+            schedule_config={"interval": 60, "start_time": "00:00", "end_time": "23:55"},
+            **kwargs
+        ).calculate_hash_id()
+
+    task = make(max_retries=1)
+    expected = models._hash_unique_data({f: getattr(task, f) for f in models._HASH_ID_FIELDS})
+    assert task.hash_id == expected
+    assert make(max_retries=1).hash_id == expected
+    assert make(max_retries=True).hash_id != expected
+
+
+def test_in_memory_database(db, task_model):
+    """Test that an in-memory database is shared across sessions."""
+    with db.get_session() as session:
+        session.add(task_model)
+        session.commit()
+
+    with db.get_session() as session:
+        assert db.count_tasks(session) == 1
+        assert db.get_task_by_id(session, task_model.hash_id) is not None
+
+
+def test_is_sqlite_memory_url():
+    """Test detection of in-memory SQLite URLs."""
+    assert database.Database._is_sqlite_memory_url("sqlite:///:memory:")
+    assert database.Database._is_sqlite_memory_url("sqlite://")
+    assert database.Database._is_sqlite_memory_url("sqlite:///file::memory:?cache=shared&uri=true")
+    assert database.Database._is_sqlite_memory_url("sqlite:///file:test?mode=memory&cache=shared&uri=true")
+    assert not database.Database._is_sqlite_memory_url("sqlite:///quickscheduler.db")
@@ -0,0 +1,66 @@
+"""Test cases for the frontend application module.
+
+The FrontEnd application and its TestClient are built once per session; backend
+API calls are patched per test through the mock_http fixture.
+"""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from quickScheduler.frontend.app import FrontEnd
+
+
+@pytest.fixture(scope="session")
+def frontend():
+    """Create the FrontEnd once for the whole test session."""
+    return FrontEnd(config={})
+
+
+@pytest.fixture(scope="session")
+def app(frontend):
+    return frontend.app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Create a TestClient shared by all frontend tests."""
+    return TestClient(app)
+
+
+@pytest.fixture
+def mock_http():
+    """Patch httpx.AsyncClient.get; tests set its return_value or side_effect."""
+    with patch("httpx.AsyncClient.get") as mock_get:
+        yield mock_get
+
+
+@pytest.fixture
+def session_cookie(frontend):
+    """Create a logged-in session and return its cookie."""
+    return {"session": frontend.auth_middleware.create_session()}
+
+
+def test_unauthenticated_redirects_to_login(client):
+    """Test pages require a session."""
+    response = client.get("/", cookies={}, follow_redirects=False)
+    assert response.status_code == 307
+    assert response.headers["location"] == "/login"
+
+
+def test_login(client):
+    """Test valid credentials set a session cookie and redirect home."""
+    response = client.post("/login", data={"username": "admin", "password": "admin"}, follow_redirects=False)
+    assert response.status_code == 303
+    assert response.cookies.get("session")
+    client.cookies.clear()
+
+
+def test_view_missing_task(client, session_cookie, mock_http):
+    """Test viewing a task the backend does not know returns 404."""
+    mock_http.return_value = httpx.Response(404, json={"detail": "Task not found"})
+    response = client.get("/tasks/missing", cookies=session_cookie)
+    assert response.status_code == 404
+    mock_http.assert_called_once_with("http://localhost:8000/tasks/missing")
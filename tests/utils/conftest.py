@@ -0,0 +1,40 @@
+import time
+from datetime import datetime
+
+import pytest
+import pytz
+
+# Timezones the trigger and datetime tests resolve
+_TEST_TIMEZONES = ("UTC", "America/New_York", "Asia/Shanghai", "Asia/Tokyo")
+
+
+def _wait_until(predicate, timeout: float = 1.0, interval: float = 0.005):
+    """Poll predicate until it returns a truthy value and return that value."""
+    deadline = time.monotonic() + timeout
+    while True:
+        value = predicate()
+        if value:
+            return value
+        if time.monotonic() >= deadline:
+            raise AssertionError(f"condition not met within {timeout}s")
+        time.sleep(interval)
+
+
+@pytest.fixture(scope="session")
+def wait_until():
+    """Return a function that polls a predicate instead of sleeping a fixed time."""
+    return _wait_until
+
+
+@pytest.fixture(scope="session")
+def yaml_loader():
+    """Return one ruamel YAML instance shared by the YamlConfig tests."""
+    from quickScheduler.utils.yaml_config import _safe_yaml
+    return _safe_yaml()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_timezones():
+    """Load the test timezones up front so no single test pays for parsing their tzfiles."""
+    for name in _TEST_TIMEZONES:
+        pytz.timezone(name).localize(datetime(2023, 1, 1))
@@ -5,7 +5,6 @@ in both the main configuration file and its dependencies.
 """
 
 import os
-import time
 import tempfile
 from pathlib import Path
 from quickScheduler.utils.yaml_config import YamlConfig
@@ -21,13 +20,14 @@ def test_has_config_file_changed():
         config = YamlConfig(temp_path)
         assert not config.has_config_file_changed(), "New file should not be detected as changed"
         
-        # Ensure file modification time will be different
-        time.sleep(0.1)
-        
         # Modify the file
         with open(temp_path, 'w') as f:
             f.write("key: updated_value\n")
         
+        # Ensure file modification time is newer without sleeping
+        mtime = os.stat(temp_path).st_mtime + 1
+        os.utime(temp_path, (mtime, mtime))
+        
         assert config.has_config_file_changed(), "Modified file should be detected as changed"
     finally:
         os.unlink(temp_path)
@@ -43,13 +43,14 @@ def test_check_and_reload_if_needed_for_main_file():
         config = YamlConfig(temp_path)
         assert config["key"] == "original_value"
         
-        # Ensure file modification time will be different
-        time.sleep(0.1)
-        
         # Modify the file
         with open(temp_path, 'w') as f:
             f.write("key: updated_value\n")
         
+        # Ensure file modification time is newer without sleeping
+        mtime = os.stat(temp_path).st_mtime + 1
+        os.utime(temp_path, (mtime, mtime))
+        
         # Check and reload if needed
         reloaded = config.check_and_reload_if_needed()
         assert reloaded, "Configuration should have been reloaded"
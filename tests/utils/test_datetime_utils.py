@@ -73,6 +73,9 @@ def test_parse_datetime_invalid():
     
     with pytest.raises(ValueError):
         parse_datetime("2023/12/25")  # Unsupported format
+    
+    with pytest.raises(ValueError):
+        parse_datetime("2023-12-25T13:45:30+05:99")  # Invalid offset minutes
 
 
 def test_convert_to_local_from_utc():
@@ -5,12 +5,11 @@ covering file monitoring, content streaming, and error handling.
 """
 
 import os
-import time
 import tempfile
 from pathlib import Path
 from quickScheduler.utils.log_monitor import LogFileMonitor
 
-def test_monitor_new_content():
+def test_monitor_new_content(wait_until):
     """Test monitoring new content written to log file."""
     with tempfile.NamedTemporaryFile(delete=False) as temp:
         log_file = temp.name
@@ -25,9 +24,7 @@ def test_monitor_new_content():
             f.flush()
 
         # Get new content
-        time.sleep(0.2)  # Give monitor time to detect changes
-        content = monitor.get()
-        assert content is not None
+        content = wait_until(monitor.get)
         assert "test line 1" in content
 
         # Write more content
@@ -35,9 +32,7 @@ def test_monitor_new_content():
             f.write("test line 2\n")
             f.flush()
 
-        time.sleep(0.2)
-        content = monitor.get()
-        assert content is not None
+        content = wait_until(monitor.get)
         assert "test line 2" in content
 
     finally:
@@ -58,7 +53,7 @@ def test_monitor_from_start():
     finally:
         os.unlink(log_file)
 
-def test_handle_file_rotation():
+def test_handle_file_rotation(wait_until):
     """Test handling of file rotation/truncation."""
     with tempfile.NamedTemporaryFile(delete=False) as temp:
         log_file = temp.name
@@ -72,9 +67,7 @@ def test_handle_file_rotation():
             f.write("initial content\n")
             f.flush()
 
-        time.sleep(0.2)
-        content = monitor.get()
-        assert content is not None
+        content = wait_until(monitor.get)
         assert "initial content" in content
 
         # Simulate file rotation by truncating
@@ -82,9 +75,7 @@ def test_handle_file_rotation():
             f.write("new content after rotation\n")
             f.flush()
 
-        time.sleep(0.2)
-        content = monitor.get()
-        assert content is not None
+        content = wait_until(monitor.get)
         assert "new content after rotation" in content
 
     finally:
@@ -95,7 +86,6 @@ def test_nonexistent_file():
     monitor = LogFileMonitor("/nonexistent/file.log")
 
     # Monitor should handle non-existent file
-    time.sleep(0.2)
     content = monitor.get()
     assert content is None
     assert monitor._get_file_size() == 0
\ No newline at end of file
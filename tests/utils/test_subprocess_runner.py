@@ -4,75 +4,70 @@ This module contains comprehensive tests for the SubProcessRunner class,
 covering process management, environment variables, and logging functionality.
 """
 
-import os
-import time
+import shlex
+import subprocess
+import sys
 import pytest
-import tempfile
 from pathlib import Path
 from quickScheduler.utils.subprocess_runner import SubProcessRunner
 
-def test_simple_command():
+# Shell targets use POSIX sh syntax (echo, $VAR, exec) and signal.pause
+posix_shell = pytest.mark.skipif(sys.platform.startswith("win"), reason="requires POSIX shell")
+
+# Blocks until signalled and exits on the SIGTERM sent by stop(); exec so the
+# shell is replaced and the signal reaches python directly
+BLOCK_CMD = f'exec {shlex.quote(sys.executable)} -c "import signal; signal.pause()"'
+
+@pytest.fixture
+def runner(tmp_path):
+    """Create a SubProcessRunner logging to a file under tmp_path."""
+    runner = SubProcessRunner(str(tmp_path / "runner.log"))
+    yield runner
+    # Never leave a blocking child behind, even if the test failed before stop()
+    if runner._thread is not None:
+        runner._thread.join(0.1)
+    process = runner.process
+    if isinstance(process, subprocess.Popen) and process.poll() is None:
+        process.kill()
+        process.wait()
+
+@posix_shell
+def test_simple_command(runner):
     """Test running a simple shell command."""
-    with tempfile.NamedTemporaryFile(delete=False) as temp:
-        log_file = temp.name
-
-    runner = SubProcessRunner(log_file)
     runner.start("echo 'test'")
-    time.sleep(0.1)  # Give process time to complete
+    assert runner.wait(timeout=2.0)
     status = runner.get_status()
     assert not status["running"]
     assert status["exit_code"] == 0
     assert "test" in status["output"]
 
-    with open(log_file, 'r') as f:
-        log_content = f.read()
-        assert "command: echo 'test'" in log_content
-    os.unlink(log_file)
-
-def test_python_callable():
+def test_python_callable(runner):
     """Test running a Python callable."""
-    with tempfile.NamedTemporaryFile(delete=False) as temp:
-        log_file = temp.name
-
-        def sample_function():
-            print("Hello from Python")
-            return
+    def sample_function():
+        print("Hello from Python")
+        return
 
-        runner = SubProcessRunner(log_file)
-        runner.start(sample_function)
-        time.sleep(0.5)  # Increase sleep time to ensure process completion
-        status = runner.get_status()
-        assert not status["running"]
-        assert status["exit_code"] == 0
+    runner.start(sample_function)
+    assert runner.wait(timeout=2.0)
+    status = runner.get_status()
+    assert not status["running"]
+    assert status["exit_code"] == 0
 
-        with open(log_file, 'r') as f:
-            log_content = f.read()
-            assert "Hello from Python" in log_content
+    assert "Hello from Python" in Path(runner.log_file).read_text()
 
-def test_environment_variables():
+@posix_shell
+def test_environment_variables(runner):
     """Test setting environment variables for shell commands."""
-    with tempfile.NamedTemporaryFile(delete=False) as temp:
-        log_file = temp.name
-
-    runner = SubProcessRunner(log_file)
     env = {"TEST_VAR": "test_value"}
     runner.start("echo $TEST_VAR", env=env)
-    time.sleep(0.1)  # Give process time to complete
+    assert runner.wait(timeout=2.0)
     status = runner.get_status()
     assert "test_value" in status["output"]
 
-    with open(log_file, 'r') as f:
-        log_content = f.read()
-        assert "command: echo $TEST_VAR" in log_content
-    os.unlink(log_file)
-
-def test_process_lifecycle():
+@posix_shell
+def test_process_lifecycle(runner):
     """Test process lifecycle management (start/stop/status)."""
-    with tempfile.NamedTemporaryFile(delete=False) as temp:
-        log_file = temp.name
-
-    runner = SubProcessRunner(log_file)
-    runner.start("sleep 10")
+    runner.start(BLOCK_CMD)
     assert runner.is_running()
     
     runner.stop()
@@ -81,32 +76,26 @@ def test_process_lifecycle():
     status = runner.get_status()
     assert not status["running"]
 
-    with open(log_file, 'r') as f:
-        log_content = f.read()
-        assert "command: sleep 10" in log_content
-    os.unlink(log_file)
-
-def test_logging():
-    """Test logging functionality."""
-    with tempfile.NamedTemporaryFile(delete=False) as temp:
-        log_file = temp.name
-
-    runner = SubProcessRunner(log_file)
-    runner.start("echo 'test logging'")
-    time.sleep(0.1)  # Give process time to complete
-
-    with open(log_file, 'r') as f:
-        log_content = f.read()
-        assert "echo 'test logging'" in log_content
-
-    os.unlink(log_file)
-
-def test_error_handling():
+@posix_shell
+@pytest.mark.parametrize("command, output", [
+    ("echo 'test logging'", "test logging"),
+    ("echo 'to stderr' >&2", "to stderr"),
+    ("echo 'before failing'; exit 3", "before failing"),
+], ids=["stdout", "stderr", "failing"])
+def test_logging_captures_commands(runner, command, output):
+    """Test the log file records the command header and its output."""
+    runner.start(command)
+    assert runner.wait(timeout=2.0)
+
+    log_content = Path(runner.log_file).read_text()
+    assert f"command: {command}" in log_content
+    assert output in log_content
+
+@posix_shell
+def test_error_handling(runner):
     """Test error handling for invalid commands and states."""
-    runner = SubProcessRunner()
-    
     # Test starting already running process
-    runner.start("sleep 5")
+    runner.start(BLOCK_CMD)
     with pytest.raises(ValueError):
         runner.start("echo 'test'")
     runner.stop()
@@ -119,23 +108,16 @@ def test_error_handling():
     with pytest.raises(TypeError):
         runner.start(123)
 
-def test_long_running_process():
+@posix_shell
+def test_long_running_process(runner):
     """Test handling of long-running processes."""
-    with tempfile.NamedTemporaryFile(delete=False) as temp:
-        log_file = temp.name
-
-    runner = SubProcessRunner(log_file)
-    runner.start("sleep 10")
+    runner.start(BLOCK_CMD)
     
     assert runner.is_running()
+    assert not runner.wait(timeout=0.01)
     status = runner.get_status()
     assert status["running"]
     assert status["exit_code"] is None
     
     runner.stop()
     assert not runner.is_running()
-
-    with open(log_file, 'r') as f:
-        log_content = f.read()
-        assert "command: sleep 10" in log_content
-    os.unlink(log_file)
\ No newline at end of file
@@ -3,25 +3,76 @@ Tests the different trigger types (Immediate, Daily, Interval) and their functio
 """
 import pytest
 from datetime import datetime, time, date, timedelta
-import pytz
+from zoneinfo import ZoneInfo
 from quickScheduler.utils.triggers import (
     TriggerType, TriggerConfig, BaseTrigger,
     ImmediateTrigger, DailyTrigger, IntervalTrigger
 )
 
+# Resolved once; TriggerConfig itself takes timezone names
+UTC_TZ = ZoneInfo("UTC")
+NY_TZ = ZoneInfo("America/New_York")
+
+# Shared immutable times and instants used across the tests
+NINE_AM = time(9, 0, 0)
+NOON = time(12, 0, 0)
+FIVE_PM = time(17, 0, 0)
+ONE_HOUR = timedelta(hours=1)
+
+JAN1_8AM = datetime(2023, 1, 1, 8, 0, 0, tzinfo=UTC_TZ)
+JAN1_9AM = datetime(2023, 1, 1, 9, 0, 0, tzinfo=UTC_TZ)
+JAN1_10AM = datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC_TZ)
+JAN1_11AM = datetime(2023, 1, 1, 11, 0, 0, tzinfo=UTC_TZ)
+JAN1_6PM = datetime(2023, 1, 1, 18, 0, 0, tzinfo=UTC_TZ)
+SATURDAY_10AM = datetime(2023, 1, 7, 10, 0, 0, tzinfo=UTC_TZ)  # 2023-01-07 is a Saturday
+
+
+def _at(d: date, hour: int, minute: int = 0) -> datetime:
+    """Return the UTC datetime at hour:minute on date d."""
+    return datetime(d.year, d.month, d.day, hour, minute, tzinfo=UTC_TZ)
+
+# (now, expected next run) tables, checked with a single comparison per trigger
+DAILY_NEXT_RUNS = [
+    # Before the run time: noon the same day
+    (JAN1_10AM, datetime(2023, 1, 1, 12, 0, 0, tzinfo=UTC_TZ)),
+    # After the run time: noon the next day
+    (datetime(2023, 1, 1, 14, 0, 0, tzinfo=UTC_TZ), datetime(2023, 1, 2, 12, 0, 0, tzinfo=UTC_TZ)),
+]
+
+INTERVAL_NEXT_RUNS = [
+    # Before the start time: first run at 9 AM
+    (JAN1_8AM, JAN1_9AM),
+    # During the interval period: next full hour
+    (datetime(2023, 1, 1, 10, 30, 0, tzinfo=UTC_TZ), JAN1_11AM),
+    # After the end time: 9 AM next day
+    (JAN1_6PM, datetime(2023, 1, 2, 9, 0, 0, tzinfo=UTC_TZ)),
+]
+
+INTERVAL_WITH_DATES_NEXT_RUNS = [
+    # Before the start time on an allowed date: 9 AM the same day
+    (JAN1_8AM, JAN1_9AM),
+    # Between start and end: next interval point
+    (JAN1_10AM, JAN1_11AM),
+    (datetime(2023, 1, 1, 9, 59, 30, tzinfo=UTC_TZ), JAN1_10AM),
+    # After the end time: 9 AM on the next allowed date
+    (JAN1_6PM, datetime(2023, 1, 3, 9, 0, 0, tzinfo=UTC_TZ)),
+    # After the end time on the last allowed date: no more runs
+    (datetime(2023, 1, 3, 18, 0, 0, tzinfo=UTC_TZ), None),
+]
+
 
 # Fixtures for common test data
-@pytest.fixture
+@pytest.fixture(scope="class")
 def utc_timezone():
     return "UTC"
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def ny_timezone():
     return "America/New_York"
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def tokyo_timezone():
     return "Asia/Tokyo"
 
@@ -31,49 +82,64 @@ def basic_config():
     return TriggerConfig()
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def daily_config(utc_timezone):
     return TriggerConfig(
         timezone=utc_timezone,
-        run_time=time(12, 0, 0),  # Noon UTC
+        run_time=NOON,  # Noon UTC
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def interval_config(utc_timezone):
     return TriggerConfig(
         timezone=utc_timezone,
-        start_time=time(9, 0, 0),  # 9 AM
-        end_time=time(17, 0, 0),   # 5 PM
-        interval=timedelta(hours=1)  # Every hour
+        start_time=NINE_AM,  # 9 AM
+        end_time=FIVE_PM,   # 5 PM
+        interval=ONE_HOUR  # Every hour
     )
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def interval_config_with_dates(utc_timezone):
     return TriggerConfig(
         timezone=utc_timezone,
-        start_time=time(9, 0, 0),  # 9 AM
-        end_time=time(17, 0, 0),   # 5 PM
-        interval=timedelta(hours=1),  # Every hour
+        start_time=NINE_AM,  # 9 AM
+        end_time=FIVE_PM,   # 5 PM
+        interval=ONE_HOUR,  # Every hour
         dates=[date(2023, 1, 1), date(2023, 1, 3)]
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
+def daily_trigger(daily_config):
+    return DailyTrigger(TriggerType.DAILY, daily_config)
+
+
+@pytest.fixture(scope="class")
+def interval_trigger(interval_config):
+    return IntervalTrigger(TriggerType.INTERVAL, interval_config)
+
+
+@pytest.fixture(scope="class")
+def interval_trigger_with_dates(interval_config_with_dates):
+    return IntervalTrigger(TriggerType.INTERVAL, interval_config_with_dates)
+
+
+@pytest.fixture(scope="class")
 def weekday_config(utc_timezone):
     return TriggerConfig(
         timezone=utc_timezone,
-        run_time=time(12, 0, 0),  # Noon UTC
+        run_time=NOON,  # Noon UTC
         weekdays={1, 2, 3, 4, 5}  # Monday to Friday
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def specific_dates_config(utc_timezone):
     today = date.today()
     return TriggerConfig(
         timezone=utc_timezone,
-        run_time=time(12, 0, 0),  # Noon UTC
+        run_time=NOON,  # Noon UTC
         dates=[today, today + timedelta(days=1), today + timedelta(days=7)]
     )
 
@@ -86,8 +152,9 @@ class TestTriggerConfig:
         assert config.timezone == "UTC"
         
         # Invalid timezone
-        with pytest.raises(ValueError, match="Invalid timezone"):
+        with pytest.raises(ValueError) as exc_info:
             TriggerConfig(timezone="Invalid/Timezone")
+        assert "Invalid timezone" in str(exc_info.value)
     
     def test_weekdays_validation(self):
         # Valid weekdays
@@ -95,38 +162,43 @@ class TestTriggerConfig:
         assert config.weekdays == {1, 2, 3}
         
         # Invalid weekday
-        with pytest.raises(ValueError, match="Weekdays must be between 1 and 7"):
+        with pytest.raises(ValueError) as exc_info:
             TriggerConfig(weekdays={0, 1, 2})
+        assert "Weekdays must be between 1 and 7" in str(exc_info.value)
         
-        with pytest.raises(ValueError, match="Weekdays must be between 1 and 7"):
+        with pytest.raises(ValueError) as exc_info:
             TriggerConfig(weekdays={1, 2, 8})
+        assert "Weekdays must be between 1 and 7" in str(exc_info.value)
     
     def test_interval_validation(self):
         # Valid configuration
         config = TriggerConfig(
-            start_time=time(9, 0),
-            end_time=time(17, 0),
-            interval=timedelta(hours=1)
+            start_time=NINE_AM,
+            end_time=FIVE_PM,
+            interval=ONE_HOUR
         )
-        assert config.start_time == time(9, 0)
-        assert config.end_time == time(17, 0)
-        assert config.interval == timedelta(hours=1)
+        assert config.start_time == NINE_AM
+        assert config.end_time == FIVE_PM
+        assert config.interval == ONE_HOUR
         
         # Missing interval
-        with pytest.raises(ValueError, match="Interval must be provided"):
-            TriggerConfig(start_time=time(9, 0), end_time=time(17, 0))
+        with pytest.raises(ValueError) as exc_info:
+            TriggerConfig(start_time=NINE_AM, end_time=FIVE_PM)
+        assert "Interval must be provided" in str(exc_info.value)
         
         # Missing end_time
-        with pytest.raises(ValueError, match="End time must be provided"):
-            TriggerConfig(start_time=time(9, 0), interval=timedelta(hours=1))
+        with pytest.raises(ValueError) as exc_info:
+            TriggerConfig(start_time=NINE_AM, interval=ONE_HOUR)
+        assert "End time must be provided" in str(exc_info.value)
         
         # End time before start time
-        with pytest.raises(ValueError, match="End time must be after start time"):
+        with pytest.raises(ValueError) as exc_info:
             TriggerConfig(
-                start_time=time(17, 0),
-                end_time=time(9, 0),
-                interval=timedelta(hours=1)
+                start_time=FIVE_PM,
+                end_time=NINE_AM,
+                interval=ONE_HOUR
             )
+        assert "End time must be after start time" in str(exc_info.value)
 
 
 # Test ImmediateTrigger
@@ -137,75 +209,58 @@ class TestImmediateTrigger:
         assert trigger.config == basic_config
     
     def test_invalid_trigger_type(self, basic_config):
-        with pytest.raises(ValueError, match="Expected trigger type immediate"):
+        with pytest.raises(ValueError) as exc_info:
             ImmediateTrigger(TriggerType.DAILY, basic_config)
+        assert "Expected trigger type immediate" in str(exc_info.value)
     
     def test_get_next_run(self, basic_config):
         trigger = ImmediateTrigger(TriggerType.IMMEDIATE, basic_config)
         
-        # First call should return the current time
-        now = datetime.now(pytz.UTC)
-        next_run = trigger.get_next_run(now)
-        assert next_run == now
+        # First call should return the given time
+        assert trigger.get_next_run(JAN1_10AM) == JAN1_10AM
         
         # Subsequent calls should return None
-        assert trigger.get_next_run(now) is None
+        assert trigger.get_next_run(JAN1_10AM) is None
     
     def test_should_run(self, basic_config):
         trigger = ImmediateTrigger(TriggerType.IMMEDIATE, basic_config)
         
         # Should run at the current time
-        now = datetime.now(pytz.UTC)
-        assert trigger.should_run(now) is True
+        assert trigger.should_run(JAN1_10AM, JAN1_10AM) is True
         
         # Should not run after the first time
-        assert trigger.should_run(now) is False
+        assert trigger.should_run(JAN1_10AM, JAN1_10AM) is False
 
 
 # Test DailyTrigger
 class TestDailyTrigger:
-    def test_initialization(self, daily_config):
-        trigger = DailyTrigger(TriggerType.DAILY, daily_config)
-        assert trigger.trigger_type == TriggerType.DAILY
-        assert trigger.config == daily_config
+    def test_initialization(self, daily_trigger, daily_config):
+        assert daily_trigger.trigger_type == TriggerType.DAILY
+        assert daily_trigger.config == daily_config
     
     def test_invalid_trigger_type(self, daily_config):
-        with pytest.raises(ValueError, match="Expected trigger type daily"):
+        with pytest.raises(ValueError) as exc_info:
             DailyTrigger(TriggerType.IMMEDIATE, daily_config)
+        assert "Expected trigger type daily" in str(exc_info.value)
     
     def test_missing_run_time(self, basic_config):
-        with pytest.raises(ValueError, match="Run time must be provided"):
+        with pytest.raises(ValueError) as exc_info:
             DailyTrigger(TriggerType.DAILY, basic_config)
+        assert "Run time must be provided" in str(exc_info.value)
     
-    def test_get_next_run_same_day(self, daily_config):
-        trigger = DailyTrigger(TriggerType.DAILY, daily_config)
-        
-        # Test with a time before the run time
-        now = datetime(2023, 1, 1, 10, 0, 0, tzinfo=pytz.UTC)  # 10 AM
-        next_run = trigger.get_next_run(now)
-        
-        expected = datetime(2023, 1, 1, 12, 0, 0, tzinfo=pytz.UTC)  # Noon
-        assert next_run == expected
-    
-    def test_get_next_run_next_day(self, daily_config):
-        trigger = DailyTrigger(TriggerType.DAILY, daily_config)
-        
-        # Test with a time after the run time
-        now = datetime(2023, 1, 1, 14, 0, 0, tzinfo=pytz.UTC)  # 2 PM
-        next_run = trigger.get_next_run(now)
-        
-        expected = datetime(2023, 1, 2, 12, 0, 0, tzinfo=pytz.UTC)  # Noon next day
-        assert next_run == expected
+    def test_get_next_run(self, daily_trigger):
+        nows, expected = zip(*DAILY_NEXT_RUNS)
+        assert list(map(daily_trigger.get_next_run, nows)) == list(expected)
     
     def test_weekday_filtering(self, weekday_config):
         trigger = DailyTrigger(TriggerType.DAILY, weekday_config)
         
         # Test with a Saturday (not in weekdays)
-        saturday = datetime(2023, 1, 7, 10, 0, 0, tzinfo=pytz.UTC)  # Saturday
+        saturday = SATURDAY_10AM
         next_run = trigger.get_next_run(saturday)
         
         # Should skip to Monday
-        expected = datetime(2023, 1, 9, 12, 0, 0, tzinfo=pytz.UTC)  # Monday noon
+        expected = datetime(2023, 1, 9, 12, 0, 0, tzinfo=UTC_TZ)  # Monday noon
         assert next_run == expected
     
     def test_date_filtering(self, specific_dates_config):
@@ -213,19 +268,18 @@ class TestDailyTrigger:
         
         # Get today's date
         today = date.today()
-        now = datetime.combine(today, time(10, 0, 0), tzinfo = pytz.UTC)
-        run_time = datetime.combine(today, time(12, 0, 0), tzinfo = pytz.UTC)
+        now = _at(today, 10)
+        run_time = _at(today, 12)
         assert trigger.should_run(run_time, now) is True
 
         # Test with a date not in the allowed dates
         invalid_date = today + timedelta(days=2)  # Not in the dates list
-        now = datetime.combine(invalid_date, time(10, 0, 0), tzinfo = pytz.UTC)
+        now = _at(invalid_date, 10)
         next_run = trigger.get_next_run(now)
         
         # Should skip to the next valid date (today + 7 days)
         expected_date = today + timedelta(days=7)
-        expected = datetime.combine(expected_date, time(12, 0, 0))
-        expected = pytz.UTC.localize(expected)
+        expected = _at(expected_date, 12)
         
         assert next_run == expected
     
@@ -233,105 +287,79 @@ class TestDailyTrigger:
         # Create a config with New York timezone
         config = TriggerConfig(
             timezone=ny_timezone,
-            run_time=time(12, 0, 0),  # Noon NY time
+            run_time=NOON,  # Noon NY time
         )
         
         trigger = DailyTrigger(TriggerType.DAILY, config)
         
         # Test with a UTC time
-        now = datetime(2023, 1, 1, 15, 0, 0, tzinfo=pytz.UTC)  # 3 PM UTC (10 AM NY)
+        now = datetime(2023, 1, 1, 15, 0, 0, tzinfo=UTC_TZ)  # 3 PM UTC (10 AM NY)
         next_run = trigger.get_next_run(now)
         
         # Expected: Noon NY time converted to UTC
-        ny_tz = pytz.timezone(ny_timezone)
-        expected_local = datetime.combine(date(2023, 1, 1), time(12, 0, 0))
-        expected_local = ny_tz.localize(expected_local)
-        expected = expected_local.astimezone(pytz.UTC)
+        expected_local = datetime.combine(date(2023, 1, 1), NOON, tzinfo=NY_TZ)
+        expected = expected_local.astimezone(UTC_TZ)
         
         assert next_run == expected
     
-    def test_should_run(self, daily_config):
-        trigger = DailyTrigger(TriggerType.DAILY, daily_config)
+    def test_should_run(self, daily_trigger):
         
         # Should run at noon UTC
-        current_date = datetime.now(pytz.UTC).date()
-        run_time = datetime.combine(current_date, time(12, 0), tzinfo=pytz.UTC)
-        now_time = datetime.combine(current_date, time(11, 0), tzinfo=pytz.UTC)
-        assert trigger.should_run(run_time, now_time) is True
+        current_date = datetime.now(UTC_TZ).date()
+        run_time = _at(current_date, 12)
+        now_time = _at(current_date, 11)
+        assert daily_trigger.should_run(run_time, now_time) is True
         
-        now_time = datetime.combine(current_date, time(12, 10), tzinfo=pytz.UTC)
-        assert trigger.should_run(run_time, now_time) is False
+        now_time = _at(current_date, 12, 10)
+        assert daily_trigger.should_run(run_time, now_time) is False
 
         # Should not run at other times
-        not_run_time = datetime.combine(current_date, time(13, 0), tzinfo=pytz.UTC)
-        assert trigger.should_run(not_run_time) is False
+        not_run_time = _at(current_date, 13)
+        assert daily_trigger.should_run(not_run_time) is False
 
 
 # Test IntervalTrigger
 class TestIntervalTrigger:
-    def test_initialization(self, interval_config):
-        trigger = IntervalTrigger(TriggerType.INTERVAL, interval_config)
-        assert trigger.trigger_type == TriggerType.INTERVAL
-        assert trigger.config == interval_config
+    def test_initialization(self, interval_trigger, interval_config):
+        assert interval_trigger.trigger_type == TriggerType.INTERVAL
+        assert interval_trigger.config == interval_config
     
     def test_invalid_trigger_type(self, interval_config):
-        with pytest.raises(ValueError, match="Expected trigger type interval"):
+        with pytest.raises(ValueError) as exc_info:
             IntervalTrigger(TriggerType.IMMEDIATE, interval_config)
+        assert "Expected trigger type interval" in str(exc_info.value)
     
     def test_missing_config_values(self):
         # Missing start_time
-        with pytest.raises(ValueError, match="Start time must be provided"):
+        with pytest.raises(ValueError) as exc_info:
             config = TriggerConfig(
-                end_time=time(17, 0),
-                interval=timedelta(hours=1)
+                end_time=FIVE_PM,
+                interval=ONE_HOUR
             )
             IntervalTrigger(TriggerType.INTERVAL, config)
+        assert "Start time must be provided" in str(exc_info.value)
         
         # Missing end_time
-        with pytest.raises(ValueError, match="End time must be provided"):
+        with pytest.raises(ValueError) as exc_info:
             config = TriggerConfig(
-                start_time=time(9, 0),
-                interval=timedelta(hours=1)
+                start_time=NINE_AM,
+                interval=ONE_HOUR
             )
             IntervalTrigger(TriggerType.INTERVAL, config)
+        assert "End time must be provided" in str(exc_info.value)
         
         # Missing interval
-        with pytest.raises(ValueError, match="Interval must be provided"):
+        with pytest.raises(ValueError) as exc_info:
             config = TriggerConfig(
-                start_time=time(9, 0),
-                end_time=time(17, 0)
+                start_time=NINE_AM,
+                end_time=FIVE_PM
             )
             IntervalTrigger(TriggerType.INTERVAL, config)
+        assert "Interval must be provided" in str(exc_info.value)
     
-    def test_get_next_run_before_start(self, interval_config):
-        trigger = IntervalTrigger(TriggerType.INTERVAL, interval_config)
-        
-        # Test with a time before the start time
-        now = datetime(2023, 1, 1, 8, 0, 0, tzinfo=pytz.UTC)  # 8 AM (before 9 AM)
-        next_run = trigger.get_next_run(now)
-        
-        expected = datetime(2023, 1, 1, 9, 0, 0, tzinfo=pytz.UTC)  # 9 AM
-        assert next_run == expected
-    
-    def test_get_next_run_during_interval(self, interval_config):
-        trigger = IntervalTrigger(TriggerType.INTERVAL, interval_config)
-        
-        # Test with a time during the interval period
-        now = datetime(2023, 1, 1, 10, 30, 0, tzinfo=pytz.UTC)  # 10:30 AM
-        next_run = trigger.get_next_run(now)
-        
-        expected = datetime(2023, 1, 1, 11, 0, 0, tzinfo=pytz.UTC)  # 11 AM
-        assert next_run == expected
-    
-    def test_get_next_run_after_end(self, interval_config):
-        trigger = IntervalTrigger(TriggerType.INTERVAL, interval_config)
-        
-        # Test with a time after the end time
-        now = datetime(2023, 1, 1, 18, 0, 0, tzinfo=pytz.UTC)  # 6 PM (after 5 PM)
-        next_run = trigger.get_next_run(now)
-        
-        expected = datetime(2023, 1, 2, 9, 0, 0, tzinfo=pytz.UTC)  # 9 AM next day
-        assert next_run == expected
+    def test_get_next_run(self, interval_trigger):
+        nows, expected = zip(*INTERVAL_NEXT_RUNS)
+        assert list(map(interval_trigger.get_next_run, nows)) == list(expected)
     
     def test_weekday_filtering(self, interval_config):
         # Modify config to only run on weekdays
@@ -346,91 +374,53 @@ class TestIntervalTrigger:
         trigger = IntervalTrigger(TriggerType.INTERVAL, config)
         
         # Test with a Saturday
-        saturday = datetime(2023, 1, 7, 10, 0, 0, tzinfo=pytz.UTC)  # Saturday
+        saturday = SATURDAY_10AM
         next_run = trigger.get_next_run(saturday)
         
         # Should skip to Monday
-        expected = datetime(2023, 1, 9, 9, 0, 0, tzinfo=pytz.UTC)  # Monday 9 AM
+        expected = datetime(2023, 1, 9, 9, 0, 0, tzinfo=UTC_TZ)  # Monday 9 AM
         assert next_run == expected
     
     def test_timezone_handling(self, interval_config, ny_timezone):
         # Create a config with New York timezone
         config = TriggerConfig(
             timezone=ny_timezone,
-            start_time=time(9, 0, 0),  # 9 AM NY time
-            end_time=time(17, 0, 0),   # 5 PM NY time
-            interval=timedelta(hours=1)
+            start_time=NINE_AM,  # 9 AM NY time
+            end_time=FIVE_PM,   # 5 PM NY time
+            interval=ONE_HOUR
         )
         
         trigger = IntervalTrigger(TriggerType.INTERVAL, config)
         
         # Test with a UTC time (when it's 8 AM in New York)
-        now = datetime(2023, 1, 1, 13, 0, 0, tzinfo=pytz.UTC)  # 1 PM UTC (8 AM NY)
+        now = datetime(2023, 1, 1, 13, 0, 0, tzinfo=UTC_TZ)  # 1 PM UTC (8 AM NY)
         next_run = trigger.get_next_run(now)
         
         # Expected: 9 AM NY time converted to UTC
-        ny_tz = pytz.timezone(ny_timezone)
-        expected_local = datetime.combine(date(2023, 1, 1), time(9, 0, 0))
-        expected_local = ny_tz.localize(expected_local)
-        expected = expected_local.astimezone(pytz.UTC)
+        expected_local = datetime.combine(date(2023, 1, 1), NINE_AM, tzinfo=NY_TZ)
+        expected = expected_local.astimezone(UTC_TZ)
         
         assert next_run == expected
     
-    def test_should_run(self, interval_config):
-        trigger = IntervalTrigger(TriggerType.INTERVAL, interval_config)
+    def test_should_run(self, interval_trigger):
         
         # Should run at interval points
-        current_date = datetime.now(pytz.UTC).date()
-        current_date = datetime.now(pytz.UTC).date()
-        run_time = datetime.combine(current_date, time(10, 0, 0), tzinfo=pytz.UTC)  # 10 AM
-        now_time = datetime.combine(current_date, time(9, 30, 0), tzinfo=pytz.UTC)  # 9:30 AM
-        assert trigger.should_run(run_time, now = now_time) is True
+        current_date = datetime.now(UTC_TZ).date()
+        run_time = _at(current_date, 10)  # 10 AM
+        now_time = _at(current_date, 9, 30)  # 9:30 AM
+        assert interval_trigger.should_run(run_time, now = now_time) is True
         
         # Should not run between intervals
-        not_run_time = datetime.combine(current_date, time(10, 30, 0), tzinfo=pytz.UTC)  # 10:30 AM
-        now_time = datetime.combine(current_date, time(9, 30, 0), tzinfo=pytz.UTC)  # 9:30 AM
-        assert trigger.should_run(not_run_time, now_time) is False
+        not_run_time = _at(current_date, 10, 30)  # 10:30 AM
+        now_time = _at(current_date, 9, 30)  # 9:30 AM
+        assert interval_trigger.should_run(not_run_time, now_time) is False
         
         # Should not run outside of start/end time
-        outside_time = datetime.combine(current_date, time(8, 0, 0), tzinfo=pytz.UTC)  # 8 AM
-        now_time = datetime.combine(current_date, time(9, 30, 0), tzinfo=pytz.UTC)  # 9:30 AM
-        assert trigger.should_run(outside_time) is False
+        outside_time = _at(current_date, 8)  # 8 AM
+        now_time = _at(current_date, 9, 30)  # 9:30 AM
+        assert interval_trigger.should_run(outside_time) is False
 
 class TestIntervalTriggerWithDates:
-    def test_get_next_run_before_start(self, interval_config_with_dates):
-        trigger = IntervalTrigger(TriggerType.INTERVAL, interval_config_with_dates)
-        
-        # Test with a time after the end time
-        now = datetime(2023, 1, 1, 8, 0, 0, tzinfo=pytz.UTC)  # 6 PM (after 5 PM)
-        next_run = trigger.get_next_run(now)
-        
-        expected = datetime(2023, 1, 1, 9, 0, 0, tzinfo=pytz.UTC)  # 9 AM next day
-        assert next_run == expected
-    
-    def test_get_next_run_after_start_before_end(self, interval_config_with_dates):
-        trigger = IntervalTrigger(TriggerType.INTERVAL, interval_config_with_dates)
-        
-        # Test with a time after the end time
-        now = datetime(2023, 1, 1, 10, 0, 0, tzinfo=pytz.UTC)  # 6 PM (after 5 PM)
-        next_run = trigger.get_next_run(now)
-        expected = datetime(2023, 1, 1, 11, 0, 0, tzinfo=pytz.UTC)  # 9 AM next day
-        assert next_run == expected
-
-        now = datetime(2023, 1, 1, 9, 59, 30, tzinfo=pytz.UTC)  # 6 PM (after 5 PM)
-        next_run = trigger.get_next_run(now)
-        expected = datetime(2023, 1, 1, 10, 0, 0, tzinfo=pytz.UTC)  # 9 AM next day
-        assert next_run == expected
-
-    def test_get_next_run_after_end(self, interval_config_with_dates):
-        trigger = IntervalTrigger(TriggerType.INTERVAL, interval_config_with_dates)
-        
-        # Test with a time after the end time
-        now = datetime(2023, 1, 1, 18, 0, 0, tzinfo=pytz.UTC)  # 6 PM (after 5 PM)
-        next_run = trigger.get_next_run(now)
-        
-        expected = datetime(2023, 1, 3, 9, 0, 0, tzinfo=pytz.UTC)  # 9 AM next day
-        assert next_run == expected
-
-        now = datetime(2023, 1, 3, 18, 0, 0, tzinfo=pytz.UTC)  # 6 PM (after 5 PM)
-        next_run = trigger.get_next_run(now)
-        assert next_run is None
\ No newline at end of file
+    def test_get_next_run(self, interval_trigger_with_dates):
+        nows, expected = zip(*INTERVAL_WITH_DATES_NEXT_RUNS)
+        assert list(map(interval_trigger_with_dates.get_next_run, nows)) == list(expected)
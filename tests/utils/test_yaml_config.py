@@ -6,49 +6,52 @@ covering file loading, environment variable substitution, and reload functionali
 
 import os
 import pytest
-import tempfile
 from pathlib import Path
 from quickScheduler.utils.yaml_config import YamlConfig
 
 
-def test_basic_loading():
+def test_basic_loading(tmp_path, yaml_loader):
     """Test basic YAML file loading."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as temp:
-        temp.write("key1: value1\nkey2: value2\n")
-        temp_path = temp.name
+    temp_path = tmp_path / "config.yaml"
+    temp_path.write_text("key1: value1\nkey2: value2\n")
 
-    try:
-        config = YamlConfig(temp_path)
-        assert config["key1"] == "value1"
-        assert config["key2"] == "value2"
-    finally:
-        os.unlink(temp_path)
+    config = YamlConfig(temp_path, yaml=yaml_loader)
+    assert config["key1"] == "value1"
+    assert config["key2"] == "value2"
 
 
-def test_env_var_substitution():
+def test_env_var_substitution(tmp_path, yaml_loader, monkeypatch):
     """Test environment variable substitution in YAML values."""
     # Set test environment variables
-    os.environ["TEST_VAR1"] = "test_value1"
-    os.environ["TEST_VAR2"] = "test_value2"
+    monkeypatch.setenv("TEST_VAR1", "test_value1")
+    monkeypatch.setenv("TEST_VAR2", "test_value2")
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as temp:
-        temp.write("key1: ${TEST_VAR1}\nkey2: prefix_${TEST_VAR2}_suffix\n")
-        temp_path = temp.name
+    temp_path = tmp_path / "config.yaml"
+    temp_path.write_text("key1: ${TEST_VAR1}\nkey2: prefix_${TEST_VAR2}_suffix\n")
 
-    try:
-        config = YamlConfig(temp_path)
-        assert config["key1"] == "test_value1"
-        assert config["key2"] == "prefix_test_value2_suffix"
-    finally:
-        os.unlink(temp_path)
+    config = YamlConfig(temp_path, yaml=yaml_loader)
+    assert config["key1"] == "test_value1"
+    assert config["key2"] == "prefix_test_value2_suffix"
 
 
-def test_nested_env_vars():
+def test_env_var_with_yaml_syntax(tmp_path, yaml_loader, monkeypatch):
+    """Test environment variable values are substituted as plain text, never parsed as YAML."""
+    monkeypatch.setenv("YAML_SYNTAX_VAR", "secret # not a comment\nother: injected")
+
+    temp_path = tmp_path / "config.yaml"
+    temp_path.write_text("password: ${YAML_SYNTAX_VAR}\n")
+
+    config = YamlConfig(temp_path, yaml=yaml_loader)
+    assert config["password"] == "secret # not a comment\nother: injected"
+    assert "other" not in config
+
+
+def test_nested_env_vars(tmp_path, yaml_loader, monkeypatch):
     """Test environment variable substitution in nested structures."""
-    os.environ["NESTED_VAR"] = "nested_value"
+    monkeypatch.setenv("NESTED_VAR", "nested_value")
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as temp:
-        temp.write("""
+    temp_path = tmp_path / "config.yaml"
+    temp_path.write_text("""
         parent:
           child1: ${NESTED_VAR}
           child2:
@@ -56,80 +59,58 @@ def test_nested_env_vars():
             - ${NESTED_VAR}
             - item3
         """)
-        temp_path = temp.name
 
-    try:
-        config = YamlConfig(temp_path)
-        assert config["parent"]["child1"] == "nested_value"
-        assert config["parent"]["child2"][1] == "nested_value"
-    finally:
-        os.unlink(temp_path)
+    config = YamlConfig(temp_path, yaml=yaml_loader)
+    assert config["parent"]["child1"] == "nested_value"
+    assert config["parent"]["child2"][1] == "nested_value"
 
 
-def test_missing_env_var():
+def test_missing_env_var(tmp_path, yaml_loader, monkeypatch):
     """Test behavior with missing environment variables."""
     # Ensure the environment variable doesn't exist
-    if "NONEXISTENT_VAR" in os.environ:
-        del os.environ["NONEXISTENT_VAR"]
+    monkeypatch.delenv("NONEXISTENT_VAR", raising=False)
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as temp:
-        temp.write("key: ${NONEXISTENT_VAR}\n")
-        temp_path = temp.name
+    temp_path = tmp_path / "config.yaml"
+    temp_path.write_text("key: ${NONEXISTENT_VAR}\n")
 
-    try:
-        config = YamlConfig(temp_path)
-        assert config["key"] == ""
-    finally:
-        os.unlink(temp_path)
+    config = YamlConfig(temp_path, yaml=yaml_loader)
+    assert config["key"] == ""
 
 
-def test_reload():
+def test_reload(tmp_path, yaml_loader):
     """Test configuration reload functionality."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as temp:
-        temp.write("key: original_value\n")
-        temp_path = temp.name
-
-    try:
-        config = YamlConfig(temp_path)
-        assert config["key"] == "original_value"
-        
-        # Modify the file and reload
-        with open(temp_path, 'w') as f:
-            f.write("key: updated_value\n")
-        
-        config.reload()
-        assert config["key"] == "updated_value"
-    finally:
-        os.unlink(temp_path)
-
-
-def test_get_with_default():
+    temp_path = tmp_path / "config.yaml"
+    temp_path.write_text("key: original_value\n")
+
+    config = YamlConfig(temp_path, yaml=yaml_loader)
+    assert config["key"] == "original_value"
+    
+    # Modify the file and reload
+    temp_path.write_text("key: updated_value\n")
+    
+    config.reload()
+    assert config["key"] == "updated_value"
+
+
+def test_get_with_default(tmp_path, yaml_loader):
     """Test get method with default values."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as temp:
-        temp.write("key1: value1\n")
-        temp_path = temp.name
+    temp_path = tmp_path / "config.yaml"
+    temp_path.write_text("key1: value1\n")
 
-    try:
-        config = YamlConfig(temp_path)
-        assert config.get("key1") == "value1"
-        assert config.get("nonexistent_key") is None
-        assert config.get("nonexistent_key", "default_value") == "default_value"
-    finally:
-        os.unlink(temp_path)
+    config = YamlConfig(temp_path, yaml=yaml_loader)
+    assert config.get("key1") == "value1"
+    assert config.get("nonexistent_key") is None
+    assert config.get("nonexistent_key", "default_value") == "default_value"
 
 
-def test_contains():
+def test_contains(tmp_path, yaml_loader):
     """Test __contains__ method."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as temp:
-        temp.write("key1: value1\n")
-        temp_path = temp.name
+    temp_path = tmp_path / "config.yaml"
+    temp_path.write_text("key1: value1\n")
 
-    try:
-        config = YamlConfig(temp_path)
-        assert "key1" in config
-        assert "nonexistent_key" not in config
-    finally:
-        os.unlink(temp_path)
+    config = YamlConfig(temp_path, yaml=yaml_loader)
+    assert "key1" in config
+    assert "nonexistent_key" not in config
 
 
 def test_file_not_found():
@@ -139,22 +120,82 @@ def test_file_not_found():
         YamlConfig(nonexistent_path)
 
 
-def test_comment_preservation():
-    """Test that comments in YAML files are preserved."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as temp:
-        temp.write("""
+def test_comments_ignored(tmp_path, yaml_loader):
+    """Test that comments in YAML files are ignored when parsing."""
+    temp_path = tmp_path / "config.yaml"
+    temp_path.write_text("""
         # This is a comment
         key1: value1  # Inline comment
         key2: value2
         """)
-        temp_path = temp.name
-
-    try:
-        config = YamlConfig(temp_path)
-        assert config["key1"] == "value1"
-        assert config["key2"] == "value2"
-        
-        # The test passes if no exceptions are raised,
-        # as we're mainly testing that comments don't break parsing
-    finally:
-        os.unlink(temp_path)
\ No newline at end of file
+
+    config = YamlConfig(temp_path, yaml=yaml_loader)
+    assert config["key1"] == "value1"
+    assert config["key2"] == "value2"
+    
+    # The test passes if no exceptions are raised,
+    # as we're mainly testing that comments don't break parsing
+
+def test_parse_cache(tmp_path, yaml_loader, monkeypatch):
+    """Test that unchanged files are parsed once and edits invalidate the cache."""
+    from quickScheduler.utils import yaml_config
+
+    temp_path = tmp_path / "config.yaml"
+    temp_path.write_text("key: ${CACHE_TEST_VAR}\n")
+
+    monkeypatch.setenv("CACHE_TEST_VAR", "first")
+    config1 = YamlConfig(temp_path, yaml=yaml_loader)
+    monkeypatch.setenv("CACHE_TEST_VAR", "second")
+    config2 = YamlConfig(temp_path, yaml=yaml_loader)
+    # Env vars are substituted per instance even when the parse is reused
+    assert config1["key"] == "first"
+    assert config2["key"] == "second"
+    assert config1.config_data is not config2.config_data
+
+    key = os.path.abspath(temp_path)
+    assert sum(1 for k in yaml_config._parse_cache if k[0] == key) == 1
+
+    temp_path.write_text("key: edited_value\n")
+    assert YamlConfig(temp_path, yaml=yaml_loader)["key"] == "edited_value"
+
+
+def test_parse_cache_per_constructor(tmp_path):
+    """Test a document parsed with the !import/!include tags is not served to a plain safe loader."""
+    from ruamel.yaml import YAML
+    from ruamel.yaml.constructor import ConstructorError
+    from quickScheduler.utils import yaml_config
+
+    (tmp_path / "shared.yaml").write_text("key: value\n")
+    temp_path = tmp_path / "config.yaml"
+    temp_path.write_text("shared: !include shared.yaml\n")
+
+    assert YamlConfig(temp_path)["shared"] == {"key": "value"}
+    with pytest.raises(ConstructorError):
+        yaml_config._load_yaml_file(temp_path, YAML(typ="safe"))
+
+
+def test_json_cache(tmp_path):
+    """Test the JSON sidecar is written, reused while fresh and skipped for non-JSON data."""
+    import json
+    from quickScheduler.utils import yaml_config
+
+    config_path = tmp_path / "config.yaml"
+    cache_path = tmp_path / "config.yaml.cache.json"
+    config_path.write_text("key: value\nitems:\n  - 1\n  - two\n")
+
+    assert YamlConfig(config_path, json_cache=True)["key"] == "value"
+    cached = json.loads(cache_path.read_text())
+    assert cached["data"] == {"key": "value", "items": [1, "two"]}
+
+    # A fresh process has an empty in-memory cache and reads the sidecar
+    yaml_config._parse_cache.clear()
+    cached["data"]["key"] = "from_sidecar"
+    cache_path.write_text(json.dumps(cached))
+    assert YamlConfig(config_path, json_cache=True)["key"] == "from_sidecar"
+
+    # Dates do not survive JSON, so no sidecar is written for them
+    dates_path = tmp_path / "dates.yaml"
+    dates_path.write_text("dates:\n  - 2023-01-01\n")
+    YamlConfig(dates_path, json_cache=True)
+    assert not (tmp_path / "dates.yaml.cache.json").exists()
+    assert not list(tmp_path.glob("*.tmp"))
@@ -4,159 +4,176 @@ This module contains tests for the YamlConfig class's ability to import
 and include other YAML configuration files.
 """
 
-import os
 import pytest
-import tempfile
-from pathlib import Path
 from quickScheduler.utils.yaml_config import YamlConfig
 
 
-def test_import_absolute_path():
-    """Test importing a YAML file using an absolute path."""
-    # Create the file to be imported
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as import_temp:
-        import_temp.write("imported_key: imported_value\n")
-        import_path = import_temp.name
-    
-    # Create the main config file that imports the other file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as main_temp:
-        main_temp.write(f"import_result: __import__({import_path})\n")
-        main_path = main_temp.name
-    
-    try:
-        config = YamlConfig(main_path)
-        assert "import_result" in config
-        assert config["import_result"]["imported_key"] == "imported_value"
-    finally:
-        os.unlink(import_path)
-        os.unlink(main_path)
-
-
-def test_import_relative_path():
-    """Test importing a YAML file using a relative path."""
-    # Create a temporary directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create the file to be imported
-        import_path = Path(temp_dir) / "imported.yaml"
-        with open(import_path, 'w') as f:
-            f.write("imported_key: imported_value\n")
-        
-        # Create the main config file that imports the other file
-        main_path = Path(temp_dir) / "main.yaml"
-        with open(main_path, 'w') as f:
-            f.write("import_result: __import__(imported.yaml)\n")
-        
-        config = YamlConfig(main_path)
-        assert "import_result" in config
-        assert config["import_result"]["imported_key"] == "imported_value"
-
-
-def test_include_absolute_path():
-    """Test including a YAML file using an absolute path."""
-    # Create the file to be included
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as include_temp:
-        include_temp.write("included_key: included_value\n")
-        include_path = include_temp.name
-    
-    # Create the main config file that includes the other file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as main_temp:
-        main_temp.write(f"include_result: __include__({include_path})\n")
-        main_path = main_temp.name
-    
-    try:
-        config = YamlConfig(main_path)
-        assert "include_result" in config
-        assert config["include_result"]["included_key"] == "included_value"
-    finally:
-        os.unlink(include_path)
-        os.unlink(main_path)
-
-
-def test_include_relative_path():
-    """Test including a YAML file using a relative path."""
-    # Create a temporary directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create the file to be included
-        include_path = Path(temp_dir) / "included.yaml"
-        with open(include_path, 'w') as f:
-            f.write("included_key: included_value\n")
-        
-        # Create the main config file that includes the other file
-        main_path = Path(temp_dir) / "main.yaml"
-        with open(main_path, 'w') as f:
-            f.write("include_result: __include__(included.yaml)\n")
-        
-        config = YamlConfig(main_path)
-        assert "include_result" in config
-        assert config["include_result"]["included_key"] == "included_value"
-
-
-def test_nested_import():
+@pytest.mark.parametrize("directive", ["import", "include"])
+@pytest.mark.parametrize("absolute", [True, False], ids=["absolute_path", "relative_path"])
+def test_directive(tmp_path, directive, absolute):
+    """Test importing or including a YAML file using an absolute or relative path."""
+    # Create the file to be imported/included
+    target_path = tmp_path / "target.yaml"
+    target_path.write_text("target_key: target_value\n")
+
+    # Create the main config file that imports/includes the other file
+    main_path = tmp_path / "main.yaml"
+    path = target_path if absolute else target_path.name
+    main_path.write_text(f"result: __{directive}__({path})\n")
+
+    config = YamlConfig(main_path)
+    assert "result" in config
+    assert config["result"]["target_key"] == "target_value"
+
+
+def test_nested_import(tmp_path):
     """Test nested imports in YAML files."""
-    # Create a temporary directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create the deepest file to be imported
-        deep_path = Path(temp_dir) / "deep.yaml"
-        with open(deep_path, 'w') as f:
-            f.write("deep_key: deep_value\n")
-        
-        # Create the middle file that imports the deep file
-        middle_path = Path(temp_dir) / "middle.yaml"
-        with open(middle_path, 'w') as f:
-            f.write("middle_key: middle_value\nmiddle_import: __import__(deep.yaml)\n")
-        
-        # Create the main config file that imports the middle file
-        main_path = Path(temp_dir) / "main.yaml"
-        with open(main_path, 'w') as f:
-            f.write("main_key: main_value\nmain_import: __import__(middle.yaml)\n")
-        
-        config = YamlConfig(main_path)
-        assert config["main_key"] == "main_value"
-        assert config["main_import"]["middle_key"] == "middle_value"
-        assert config["main_import"]["middle_import"]["deep_key"] == "deep_value"
-
-
-def test_env_vars_in_imported_file():
+    # Create the deepest file to be imported
+    deep_path = tmp_path / "deep.yaml"
+    deep_path.write_text("deep_key: deep_value\n")
+
+    # Create the middle file that imports the deep file
+    middle_path = tmp_path / "middle.yaml"
+    middle_path.write_text("middle_key: middle_value\nmiddle_import: __import__(deep.yaml)\n")
+
+    # Create the main config file that imports the middle file
+    main_path = tmp_path / "main.yaml"
+    main_path.write_text("main_key: main_value\nmain_import: __import__(middle.yaml)\n")
+
+    config = YamlConfig(main_path)
+    assert config["main_key"] == "main_value"
+    assert config["main_import"]["middle_key"] == "middle_value"
+    assert config["main_import"]["middle_import"]["deep_key"] == "deep_value"
+
+
+def test_repeated_import_parsed_once(tmp_path, monkeypatch):
+    """Test a file imported and included several times is parsed once, with separate copies per use."""
+    from quickScheduler.utils.yaml_config import _safe_yaml
+
+    yaml = _safe_yaml()
+    loaded = []
+    load = yaml.load
+    monkeypatch.setattr(yaml, "load", lambda stream: loaded.append(stream) or load(stream))
+
+    shared_path = tmp_path / "shared.yaml"
+    shared_path.write_text("shared_key: [1, 2]\n")
+
+    main_path = tmp_path / "main.yaml"
+    main_path.write_text("first: __import__(shared.yaml)\nsecond: __import__(shared.yaml)\nthird: __include__(shared.yaml)\n")
+
+    config = YamlConfig(main_path, yaml=yaml)
+    assert loaded.count(shared_path.read_bytes()) == 1
+
+    config["first"]["shared_key"].append(3)
+    assert config["second"]["shared_key"] == [1, 2]
+    assert config["third"]["shared_key"] == [1, 2]
+
+
+def test_repeated_include_shared(tmp_path):
+    """Test a file included several times in one config is resolved once and shared."""
+    include_path = tmp_path / "included.yaml"
+    include_path.write_text("included_key: included_value\n")
+
+    main_path = tmp_path / "main.yaml"
+    main_path.write_text("first: __include__(included.yaml)\nsecond: __include__(included.yaml)\n")
+
+    config = YamlConfig(main_path)
+    assert config["first"]["included_key"] == "included_value"
+    assert config["first"] is config["second"]
+
+
+def test_env_vars_in_imported_file(tmp_path, monkeypatch):
     """Test environment variable substitution in imported files."""
-    os.environ["IMPORT_TEST_VAR"] = "import_test_value"
-    
-    # Create a temporary directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create the file to be imported with env vars
-        import_path = Path(temp_dir) / "imported.yaml"
-        with open(import_path, 'w') as f:
-            f.write("env_key: ${IMPORT_TEST_VAR}\n")
-        
-        # Create the main config file that imports the other file
-        main_path = Path(temp_dir) / "main.yaml"
-        with open(main_path, 'w') as f:
-            f.write("import_result: __import__(imported.yaml)\n")
-        
-        config = YamlConfig(main_path)
-        assert config["import_result"]["env_key"] == "import_test_value"
-
-
-def test_file_not_found_import():
-    """Test behavior when imported file is not found."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as main_temp:
-        main_temp.write("import_result: __import__(nonexistent.yaml)\n")
-        main_path = main_temp.name
-    
-    try:
-        with pytest.raises(FileNotFoundError):
-            YamlConfig(main_path)
-    finally:
-        os.unlink(main_path)
-
-
-def test_file_not_found_include():
-    """Test behavior when included file is not found."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as main_temp:
-        main_temp.write("include_result: __include__(nonexistent.yaml)\n")
-        main_path = main_temp.name
-    
-    try:
-        with pytest.raises(FileNotFoundError):
-            YamlConfig(main_path)
-    finally:
-        os.unlink(main_path)
\ No newline at end of file
+    monkeypatch.setenv("IMPORT_TEST_VAR", "import_test_value")
+
+    # Create the file to be imported with env vars
+    import_path = tmp_path / "imported.yaml"
+    import_path.write_text("env_key: ${IMPORT_TEST_VAR}\n")
+
+    # Create the main config file that imports the other file
+    main_path = tmp_path / "main.yaml"
+    main_path.write_text("import_result: __import__(imported.yaml)\n")
+
+    config = YamlConfig(main_path)
+    assert config["import_result"]["env_key"] == "import_test_value"
+
+
+@pytest.mark.parametrize("directive", ["import", "include"])
+def test_file_not_found(tmp_path, directive):
+    """Test behavior when the imported/included file is not found."""
+    main_path = tmp_path / "main.yaml"
+    main_path.write_text(f"result: __{directive}__(nonexistent.yaml)\n")
+
+    with pytest.raises(FileNotFoundError):
+        YamlConfig(main_path)
+
+
+def test_circular_import(tmp_path):
+    """Test that files importing each other raise instead of recursing forever."""
+    a_path = tmp_path / "a.yaml"
+    a_path.write_text("b: __import__(b.yaml)\n")
+
+    b_path = tmp_path / "b.yaml"
+    b_path.write_text("a: __import__(a.yaml)\n")
+
+    with pytest.raises(ValueError, match="Circular import/include detected"):
+        YamlConfig(a_path)
+
+
+def test_circular_include(tmp_path):
+    """Test that a file including itself raises instead of recursing forever."""
+    main_path = tmp_path / "main.yaml"
+    main_path.write_text("self: __include__(main.yaml)\n")
+
+    with pytest.raises(ValueError, match="Circular import/include detected"):
+        YamlConfig(main_path)
+
+
+def test_diamond_import_is_not_circular(tmp_path):
+    """Test that two branches importing the same file is allowed."""
+    for name, content in [
+        ("shared.yaml", "shared_key: shared_value\n"),
+        ("left.yaml", "shared: __import__(shared.yaml)\n"),
+        ("right.yaml", "shared: __include__(shared.yaml)\n"),
+        ("main.yaml", "left: __import__(left.yaml)\nright: __import__(right.yaml)\n"),
+    ]:
+        (tmp_path / name).write_text(content)
+
+    config = YamlConfig(tmp_path / "main.yaml")
+    assert config["left"]["shared"]["shared_key"] == "shared_value"
+    assert config["right"]["shared"]["shared_key"] == "shared_value"
+
+
+def test_import_include_tags(tmp_path, monkeypatch):
+    """Test the !import and !include tags, including env vars in their paths."""
+    monkeypatch.setenv("TAG_TEST_DIR", ".")
+
+    shared_path = tmp_path / "shared.yaml"
+    shared_path.write_text("shared_key: shared_value\n")
+
+    main_path = tmp_path / "main.yaml"
+    main_path.write_text("imported: !import shared.yaml\nincluded: !include ${TAG_TEST_DIR}/shared.yaml\n")
+
+    config = YamlConfig(main_path)
+    assert config["imported"]["shared_key"] == "shared_value"
+    assert config["included"]["shared_key"] == "shared_value"
+
+
+def test_sibling_directives(tmp_path):
+    """Test sibling imports/includes resolve in document order."""
+    for name in ("one", "two", "three"):
+        (tmp_path / f"{name}.yaml").write_text(f"{name}_key: {name}_value\n")
+
+    main_path = tmp_path / "main.yaml"
+    main_path.write_text("one: __import__(one.yaml)\ntwo: !include two.yaml\nthree: __include__(three.yaml)\n")
+
+    config = YamlConfig(main_path)
+    assert config["one"]["one_key"] == "one_value"
+    assert config["two"]["two_key"] == "two_value"
+    assert config["three"]["three_key"] == "three_value"
+    assert list(config.dependencies) == [str(main_path)] + [str(tmp_path / f"{name}.yaml") for name in ("one", "two", "three")]
+
+    # A missing sibling is still reported once resolution reaches it
+    main_path.write_text("one: __import__(one.yaml)\nmissing: __include__(missing.yaml)\n")
+    with pytest.raises(FileNotFoundError):
+        YamlConfig(main_path)